@@ -9,13 +9,17 @@
 Smart Babylon Library - Infinite Deterministic Text Universe
 """
 from smart_babylon_library.library.core import SmartBabylonLibrary
+from smart_babylon_library.library.async_library import AsyncSmartBabylonLibrary
 from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.coordinate_array import CoordinateArray
 from smart_babylon_library.library.book import LibraryBook, LibraryPage
 from smart_babylon_library.library.config import LibraryConfig
 
 __all__ = [
     'SmartBabylonLibrary',
+    'AsyncSmartBabylonLibrary',
     'LibraryCoordinates',
+    'CoordinateArray',
     'LibraryBook',
     'LibraryPage',
     'LibraryConfig'
@@ -0,0 +1,13 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import sys
+
+from smart_babylon_library.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main())
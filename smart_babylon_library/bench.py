@@ -0,0 +1,218 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Benchmark suite: python -m smart_babylon_library.bench [--baseline FILE]
+
+Reports ops/s, chars/s and peak traced memory per benchmark as JSON and can
+compare against a saved run, exiting with status 1 when any benchmark is
+slower than the baseline by more than --threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from smart_babylon_library.character_sets.alphabets import LatinAlphabet
+from smart_babylon_library.character_sets.digits import Digits
+from smart_babylon_library.library.config import LibraryConfig, SUPPORTED_ENGINES
+from smart_babylon_library.library.core import SmartBabylonLibrary
+
+PAGE_SIZES = (100, 5000, 50000)
+DEFAULT_MIN_TIME = 0.5
+DEFAULT_THRESHOLD = 0.15
+
+
+def _available_engines() -> List[str]:
+    engines = []
+    for engine in SUPPORTED_ENGINES:
+        try:
+            SmartBabylonLibrary(LibraryConfig(engine=engine))
+        except ImportError:
+            continue
+        engines.append(engine)
+    return engines
+
+
+def _counter():
+    state = {'index': 0}
+
+    def next_index() -> int:
+        state['index'] += 1
+        return state['index']
+    return next_index
+
+
+def _page_benchmark(library: SmartBabylonLibrary) -> Callable[[], int]:
+    next_index = _counter()
+
+    def run() -> int:
+        index = next_index()
+        return len(library.get_page(1, index % 97, 3, 4, index // 97, index % 31).content)
+    return run
+
+
+def _title_benchmark(library: SmartBabylonLibrary) -> Callable[[], int]:
+    next_index = _counter()
+
+    def run() -> int:
+        index = next_index()
+        return len(library.get_book(1, 2, index % 13, index // 13, index % 7).title)
+    return run
+
+
+def _max_pages_benchmark(library: SmartBabylonLibrary) -> Callable[[], int]:
+    next_index = _counter()
+
+    def run() -> int:
+        index = next_index()
+        library.get_book(1, 2, 3, index % 17, index).max_pages
+        return 0
+    return run
+
+
+def _json_benchmark(library: SmartBabylonLibrary) -> Callable[[], int]:
+    page = library.get_page(1, 2, 3, 4, 5, 6)
+    page.content
+
+    def run() -> int:
+        return len(page.to_json())
+    return run
+
+
+def _batch_benchmark(library: SmartBabylonLibrary, workers: int, size: int = 64) -> Callable[[], int]:
+    next_index = _counter()
+
+    def run() -> int:
+        book = next_index()
+        coordinates = [(1, 2, 3, 4, book, page) for page in range(size)]
+        return sum(len(page.content) for page in library.get_pages(coordinates, workers=workers))
+    return run
+
+
+def build_benchmarks(engines: List[str], workers: int) -> Dict[str, Tuple[Callable[[], int], int]]:
+    """Map benchmark name to (benchmark function, operations per call)."""
+    benchmarks = {}
+    for engine in engines:
+        def library(**options):
+            return SmartBabylonLibrary(LibraryConfig(universe='bench', engine=engine, **options))
+
+        benchmarks[f'{engine}/title'] = (_title_benchmark(library()), 1)
+        benchmarks[f'{engine}/max_pages'] = (_max_pages_benchmark(library()), 1)
+        for size in PAGE_SIZES:
+            sized = library(content_length_range=(size, size))
+            benchmarks[f'{engine}/page/{size}'] = (_page_benchmark(sized), 1)
+        benchmarks[f'{engine}/page/custom_charset'] = (
+            _page_benchmark(library(content_length_range=(5000, 5000),
+                                    character_sets=[LatinAlphabet(), Digits()])), 1)
+        benchmarks[f'{engine}/to_json/5000'] = (_json_benchmark(library(content_length_range=(5000, 5000))), 1)
+        batch_library = library(content_length_range=(5000, 5000))
+        benchmarks[f'{engine}/batch/64'] = (_batch_benchmark(batch_library, None), 64)
+        if workers > 1:
+            benchmarks[f'{engine}/batch/64/workers={workers}'] = (_batch_benchmark(batch_library, workers), 64)
+    return benchmarks
+
+
+def run_benchmark(function: Callable[[], int], operations: int, min_time: float) -> dict:
+    function()
+    calls = chars = 0
+    started = time.perf_counter()
+    while True:
+        chars += function()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+
+    tracemalloc.start()
+    try:
+        function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'ops_per_sec': calls * operations / elapsed,
+        'chars_per_sec': chars / elapsed,
+        'peak_memory_bytes': peak,
+        'iterations': calls,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get('ops_per_sec'):
+            continue
+        ratio = result['ops_per_sec'] / previous['ops_per_sec']
+        if ratio < 1 - threshold:
+            regressions.append(f"{name}: {ratio:.2f}x of baseline "
+                               f"({result['ops_per_sec']:.1f} vs {previous['ops_per_sec']:.1f} ops/s)")
+    return regressions
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m smart_babylon_library.bench',
+                                     description='Smart Babylon Library benchmarks')
+    parser.add_argument('-o', '--output', help='write the JSON report to this file')
+    parser.add_argument('-b', '--baseline', help='compare against a previously saved JSON report')
+    parser.add_argument('-t', '--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown as a fraction (default: %(default)s)')
+    parser.add_argument('-k', '--filter', action='append', default=[],
+                        help='only run benchmarks whose name contains this text (repeatable)')
+    parser.add_argument('--engine', action='append', choices=SUPPORTED_ENGINES,
+                        help='engines to benchmark (default: all available)')
+    parser.add_argument('-w', '--workers', type=int, default=0, help='also benchmark batches with N workers')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help='seconds per benchmark (default: %(default)s)')
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    engines = args.engine or _available_engines()
+    results = {}
+    for name, (function, operations) in build_benchmarks(engines, args.workers).items():
+        if args.filter and not any(text in name for text in args.filter):
+            continue
+        results[name] = run_benchmark(function, operations, args.min_time)
+        print(f"{name:45} {results[name]['ops_per_sec']:12.1f} ops/s "
+              f"{results[name]['chars_per_sec']:14.0f} chars/s", file=sys.stderr)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'min_time': args.min_time,
+        },
+        'results': results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as fp:
+            fp.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as fp:
+            baseline = json.load(fp)['results']
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,12 +13,14 @@ from smart_babylon_library.character_sets.constants import (
 )
 from smart_babylon_library.character_sets.core import CharacterSet
 
+_CYRILLIC_CHARACTERS = tuple(sorted(CYRILLIC_UPPERCASE + CYRILLIC_LOWERCASE))
+_LATIN_CHARACTERS = tuple(sorted(LATIN_UPPERCASE + LATIN_LOWERCASE))
+
 
 class CyrillicAlphabet(CharacterSet):
     @property
     def characters(self):
-        chars = list(CYRILLIC_UPPERCASE + CYRILLIC_LOWERCASE)
-        return sorted(chars)
+        return list(_CYRILLIC_CHARACTERS)
 
     @property
     def name(self) -> str:
@@ -27,8 +29,7 @@ class CyrillicAlphabet(CharacterSet):
 class LatinAlphabet(CharacterSet):
     @property
     def characters(self):
-        chars = list(LATIN_UPPERCASE + LATIN_LOWERCASE)
-        return sorted(chars)
+        return list(_LATIN_CHARACTERS)
 
     @property
     def name(self) -> str:
@@ -8,12 +8,13 @@
 from smart_babylon_library.character_sets.constants import DIGITS
 from smart_babylon_library.character_sets.core import CharacterSet
 
+_DIGIT_CHARACTERS = tuple(sorted(DIGITS))
+
 
 class Digits(CharacterSet):
     @property
     def characters(self):
-        chars = list(DIGITS)
-        return sorted(chars)
+        return list(_DIGIT_CHARACTERS)
 
     @property
     def name(self) -> str:
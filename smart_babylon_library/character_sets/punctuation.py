@@ -8,12 +8,13 @@
 from smart_babylon_library.character_sets.constants import PUNCTUATION_MARKS
 from smart_babylon_library.character_sets.core import CharacterSet
 
+_PUNCTUATION_CHARACTERS = tuple(sorted(PUNCTUATION_MARKS))
+
 
 class Punctuation(CharacterSet):
     @property
     def characters(self):
-        chars = list(PUNCTUATION_MARKS)
-        return sorted(chars)
+        return list(_PUNCTUATION_CHARACTERS)
 
     @property
     def name(self) -> str:
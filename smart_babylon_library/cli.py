@@ -0,0 +1,125 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Command line interface: python -m smart_babylon_library <command> ...
+"""
+import argparse
+import json
+import sys
+
+from smart_babylon_library.library.config import JSON_FORMATS, LibraryConfig, SUPPORTED_ENGINES
+from smart_babylon_library.library.core import SmartBabylonLibrary
+from smart_babylon_library.library.export import EXPORT_FORMATS, BookExporter
+from smart_babylon_library.library.region import AXES, parse_axis
+from smart_babylon_library.library.server import serve
+
+
+def _add_config_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group('library configuration')
+    group.add_argument('--universe', default='default', help='universe name (default: %(default)s)')
+    group.add_argument('--engine', default='legacy', choices=SUPPORTED_ENGINES,
+                       help='generation engine (default: %(default)s)')
+    group.add_argument('--json-format', default='pretty', choices=JSON_FORMATS,
+                       help='layout of JSON responses (default: %(default)s)')
+    group.add_argument('--title-length', nargs=2, type=int, metavar=('MIN', 'MAX'))
+    group.add_argument('--content-length', nargs=2, type=int, metavar=('MIN', 'MAX'))
+    group.add_argument('--pages-per-book', nargs=2, type=int, metavar=('MIN', 'MAX'))
+
+
+def _config_from_arguments(args) -> LibraryConfig:
+    options = {'universe': args.universe, 'engine': args.engine, 'json_format': args.json_format}
+    if args.title_length:
+        options['title_length_range'] = tuple(args.title_length)
+    if args.content_length:
+        options['content_length_range'] = tuple(args.content_length)
+    if args.pages_per_book:
+        options['pages_per_book_range'] = tuple(args.pages_per_book)
+    return LibraryConfig(**options)
+
+
+def _export(args) -> int:
+    library = SmartBabylonLibrary(_config_from_arguments(args))
+    book = library.get_book(*args.coordinates)
+
+    def report(progress):
+        print(f"\r{progress}", end='', file=sys.stderr, flush=True)
+
+    exporter = BookExporter(library, workers=args.workers, window=args.window,
+                            progress=None if args.quiet else report)
+    if args.output in (None, '-'):
+        exporter.export(book, sys.stdout, args.format, args.start_page, args.end_page)
+    else:
+        with open(args.output, 'w', encoding='utf-8', newline='\n') as fp:
+            exporter.export(book, fp, args.format, args.start_page, args.end_page)
+    if not args.quiet:
+        print(file=sys.stderr)
+    return 0
+
+
+def _scan(args) -> int:
+    library = SmartBabylonLibrary(_config_from_arguments(args))
+    region = {axis: getattr(args, axis) for axis in AXES}
+    coordinates = library.iter_page_coordinates(**region)
+    result = library.scan(coordinates, args.pattern, workers=args.workers, max_hits=args.max_hits)
+    for hit in result.hits:
+        print(json.dumps(hit.to_dict(), ensure_ascii=False))
+    print(json.dumps(result.metrics()), file=sys.stderr)
+    return 0 if result.hits else 1
+
+
+def _serve(args) -> int:
+    library = SmartBabylonLibrary(_config_from_arguments(args))
+    print(f"Serving universe '{library.config.universe}' on http://{args.host}:{args.port}", file=sys.stderr)
+    serve(library, args.host, args.port, workers=args.workers, executor=args.executor)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m smart_babylon_library',
+                                     description='Smart Babylon Library tools')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    export = commands.add_parser('export', help='export a whole book')
+    export.add_argument('coordinates', nargs=5, type=int, metavar=('FLOOR', 'ROOM', 'CABINET', 'SHELF', 'BOOK'))
+    export.add_argument('-f', '--format', default='jsonl', choices=EXPORT_FORMATS,
+                        help='jsonl records, plain text, or the title followed by the pages (default: %(default)s)')
+    export.add_argument('-o', '--output', help='output file (default: stdout)')
+    export.add_argument('-w', '--workers', type=int, help='number of worker processes')
+    export.add_argument('--window', type=int, help='maximum page batches in flight')
+    export.add_argument('--start-page', type=int, default=0)
+    export.add_argument('--end-page', type=int, help='export pages before this number')
+    export.add_argument('-q', '--quiet', action='store_true', help='do not report progress')
+    _add_config_arguments(export)
+    export.set_defaults(handler=_export)
+
+    scan = commands.add_parser('scan', help='search a coordinate region for patterns',
+                               description='Axes accept a number, START:STOP or a comma separated list.')
+    for axis in AXES[:5]:
+        scan.add_argument(f'--{axis}', type=parse_axis, required=True, metavar='SPEC')
+    scan.add_argument('--page', type=parse_axis, metavar='SPEC', help='pages to scan (default: all pages)')
+    scan.add_argument('-p', '--pattern', action='append', required=True, help='pattern to find (repeatable)')
+    scan.add_argument('-n', '--max-hits', type=int, help='stop after this many hits')
+    scan.add_argument('-w', '--workers', type=int, help='number of worker processes')
+    _add_config_arguments(scan)
+    scan.set_defaults(handler=_scan)
+
+    server = commands.add_parser('serve', help='serve books and pages over HTTP')
+    server.add_argument('--host', default='127.0.0.1', help='bind address (default: %(default)s)')
+    server.add_argument('--port', type=int, default=8000, help='port (default: %(default)s)')
+    server.add_argument('-w', '--workers', type=int, help='generation workers (default: CPU count)')
+    server.add_argument('--executor', default='process', choices=('process', 'thread'),
+                        help='worker pool type (default: %(default)s)')
+    _add_config_arguments(server)
+    server.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
@@ -0,0 +1,188 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Asyncio facade over SmartBabylonLibrary.
+
+Generation runs in a thread or process executor, at most ``max_concurrency``
+generations run at once, and concurrent requests for the same item share a
+single generation. Cancelling a request cancels its generation once no other
+request is waiting for it; work already running in an executor finishes in
+the background, but its result is discarded.
+"""
+import asyncio
+import concurrent.futures
+import os
+from collections import deque
+
+from smart_babylon_library.library.book import LibraryBook, LibraryPage
+from smart_babylon_library.library.cache import ContentCache
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.core import SmartBabylonLibrary
+from smart_babylon_library.library.generator import coordinate_values
+from smart_babylon_library.library.parallel import (
+    _init_worker, _run_batch, coordinate_tuples, generate_book_metadata, generate_page
+)
+
+EXECUTORS = ('thread', 'process')
+
+
+class AsyncSmartBabylonLibrary:
+    """
+    ``executor='thread'`` generates through the wrapped library, including its
+    cache and mounted shards; ``executor='process'`` sidesteps the GIL, and its
+    workers compile their own generators from the config.
+    """
+
+    def __init__(self, config: LibraryConfig = None, cache: ContentCache = None, executor: str = 'thread',
+                 workers: int = None, max_concurrency: int = None, library: SmartBabylonLibrary = None):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Executor must be one of {', '.join(EXECUTORS)}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+        self.library = library or SmartBabylonLibrary(config, cache)
+        self.executor = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.workers * 2
+        self._pool = None
+        self._semaphore = None
+        # (kind, coordinates) -> [future, number of waiting requests]
+        self._in_flight = {}
+
+    @property
+    def config(self) -> LibraryConfig:
+        return self.library.config
+
+    def _get_pool(self):
+        if self._pool is None:
+            if self.executor == 'process':
+                self._pool = concurrent.futures.ProcessPoolExecutor(
+                    self.workers, initializer=_init_worker, initargs=(self.config,))
+            else:
+                self._pool = concurrent.futures.ThreadPoolExecutor(self.workers)
+        return self._pool
+
+    async def _offload(self, task, values):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_event_loop()
+            if self.executor == 'process':
+                results = await loop.run_in_executor(self._get_pool(), _run_batch, task, [values])
+                return results[0]
+            return await loop.run_in_executor(self._get_pool(), task, self.library.generator, values)
+
+    async def _coalesced(self, kind: str, task, values):
+        key = (kind, values)
+        entry = self._in_flight.get(key)
+        if entry is None:
+            entry = [asyncio.ensure_future(self._offload(task, values)), 0]
+            self._in_flight[key] = entry
+
+            def forget(_):
+                if self._in_flight.get(key) is entry:
+                    del self._in_flight[key]
+            entry[0].add_done_callback(forget)
+        entry[1] += 1
+        try:
+            # Shielded so that one cancelled request does not cancel the others' result.
+            return await asyncio.shield(entry[0])
+        finally:
+            entry[1] -= 1
+            if not entry[1] and not entry[0].done():
+                entry[0].cancel()
+
+    def _page(self, values, content: str) -> LibraryPage:
+        page = LibraryPage(LibraryCoordinates(*values), self.config, self.library.generator)
+        page._content = content
+        return page
+
+    def _book(self, values, metadata) -> LibraryBook:
+        book = LibraryBook(LibraryCoordinates(*values), self.config, self.library.generator)
+        book._title, book._max_pages = metadata
+        return book
+
+    async def _get_page(self, coordinates: LibraryCoordinates) -> LibraryPage:
+        values = coordinate_values(coordinates)
+        return self._page(values, await self._coalesced('page', generate_page, values))
+
+    async def _get_book(self, coordinates: LibraryCoordinates) -> LibraryBook:
+        values = coordinate_values(coordinates)
+        return self._book(values, await self._coalesced('book', generate_book_metadata, values))
+
+    async def get_page(self, floor: int, room: int, cabinet: int, shelf: int, book_number: int,
+                       page: int) -> LibraryPage:
+        """Return a page whose content has already been generated off the event loop."""
+        return await self._get_page(LibraryCoordinates(floor, room, cabinet, shelf, book_number, page))
+
+    async def get_page_from_dict(self, coordinates_dict: dict) -> LibraryPage:
+        return await self._get_page(LibraryCoordinates.from_dict(coordinates_dict))
+
+    async def get_book(self, floor: int, room: int, cabinet: int, shelf: int, book_number: int) -> LibraryBook:
+        """Return a book whose title and page count have already been generated off the event loop."""
+        return await self._get_book(LibraryCoordinates(floor, room, cabinet, shelf, book_number, 0))
+
+    async def get_book_from_dict(self, coordinates_dict: dict) -> LibraryBook:
+        return await self._get_book(LibraryCoordinates.from_dict(coordinates_dict))
+
+    async def _iter_results(self, kind: str, task, items, ordered: bool):
+        running = deque()
+        try:
+            for values in items:
+                running.append((values, asyncio.ensure_future(self._coalesced(kind, task, values))))
+                if len(running) < self.max_concurrency:
+                    continue
+                if ordered:
+                    values, future = running.popleft()
+                    yield values, await future
+                else:
+                    for values, result in await self._completed(running):
+                        yield values, result
+            while running:
+                if ordered:
+                    values, future = running.popleft()
+                    yield values, await future
+                else:
+                    for values, result in await self._completed(running):
+                        yield values, result
+        finally:
+            for _, future in running:
+                future.cancel()
+
+    @staticmethod
+    async def _completed(running: deque) -> list:
+        await asyncio.wait([future for _, future in running], return_when=asyncio.FIRST_COMPLETED)
+        done = [(values, future) for values, future in running if future.done()]
+        for item in done:
+            running.remove(item)
+        return [(values, future.result()) for values, future in done]
+
+    async def iter_pages(self, coordinates, ordered: bool = True):
+        """Asynchronously yield pages for an iterable of coordinates, ``max_concurrency`` at a time."""
+        async for values, content in self._iter_results('page', generate_page, coordinate_tuples(coordinates),
+                                                        ordered):
+            yield self._page(values, content)
+
+    async def iter_books(self, coordinates, ordered: bool = True):
+        """Asynchronously yield books with their metadata for an iterable of book coordinates."""
+        async for values, metadata in self._iter_results('book', generate_book_metadata,
+                                                         coordinate_tuples(coordinates, book=True), ordered):
+            yield self._book(values, metadata)
+
+    async def close(self):
+        for future, _ in list(self._in_flight.values()):
+            future.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
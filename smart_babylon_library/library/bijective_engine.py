@@ -0,0 +1,212 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Invertible page generation engine ("bijective-v1").
+
+Coordinates are folded into one integer with nested Szudzik pairings, the
+integer is written as an L-digit number over the distinct alphabet symbols
+(L = content_length_range[1], so every page has the same length), and the
+digits are shuffled by a keyed four-round Feistel permutation. Every step
+can be inverted, so any text can be located: place it on a page, undo the
+permutation and read the coordinates off the resulting number.
+"""
+import hashlib
+import math
+from typing import List, Tuple
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE, AcceleratedGenerator, coordinate_values
+
+FEISTEL_ROUNDS = 4
+_DIRECT_DIGITS = 64
+
+
+def _isqrt(value: int) -> int:
+    if hasattr(math, 'isqrt'):
+        return math.isqrt(value)
+    if value < 2:
+        return value
+    root = 1 << ((value.bit_length() + 1) // 2)
+    while True:
+        smaller = (root + value // root) // 2
+        if smaller >= root:
+            return root
+        root = smaller
+
+
+def _pair(x: int, y: int) -> int:
+    return y * y + x if x < y else x * x + x + y
+
+
+def _unpair(z: int) -> Tuple[int, int]:
+    root = _isqrt(z)
+    rest = z - root * root
+    return (rest, root) if rest < root else (root, rest - root)
+
+
+def coordinates_to_number(coordinates) -> int:
+    floor, room, cabinet, shelf, book, number = coordinate_values(coordinates)
+    for value in (book, shelf, cabinet, room, floor):
+        number = _pair(value, number)
+    return number
+
+
+def number_to_coordinates(number: int) -> LibraryCoordinates:
+    values = []
+    for _ in range(5):
+        value, number = _unpair(number)
+        values.append(value)
+    return LibraryCoordinates(*values, number)
+
+
+class BijectiveGenerator(AcceleratedGenerator):
+    engine = 'bijective-v1'
+
+    def __init__(self, config: LibraryConfig):
+        super().__init__(config)
+        self._symbols = sorted(set(self._all_chars))
+        self._symbol_index = {symbol: index for index, symbol in enumerate(self._symbols)}
+        self._symbol_char_index = [self._char_index[symbol] for symbol in self._symbols]
+        self._single_code_points = all(len(symbol) == 1 for symbol in self._symbols)
+        self._max_symbol_length = max((len(symbol) for symbol in self._symbols), default=0)
+        self._radix = len(self._symbols)
+        self._page_length = self.config.content_length_range[1]
+        self._powers = {}
+        self._capacity = self._power(self._page_length) if self._radix > 1 else 1
+
+    def _bind_universe(self):
+        super()._bind_universe()
+        self._key = hashlib.sha256(self._universe_prefix + f"{self.engine}:".encode()).digest()
+
+    def _derive_coordinate_seed(self, kind: str, coordinates) -> int:
+        # Titles and page counts hash the bytes of the coordinate number: located
+        # coordinates are too large for the decimal seed strings of other engines.
+        number = coordinates_to_number(coordinates)
+        data = number.to_bytes((number.bit_length() + 7) // 8, 'big')
+        return int.from_bytes(hashlib.sha256(self._key + f"{kind}:".encode() + data).digest(), 'big')
+
+    def _power(self, exponent: int) -> int:
+        power = self._powers.get(exponent)
+        if power is None:
+            power = self._powers[exponent] = self._radix ** exponent
+        return power
+
+    def _to_digits(self, value: int, count: int) -> List[int]:
+        if not value:
+            return [0] * count
+        if count <= _DIRECT_DIGITS:
+            digits = []
+            for _ in range(count):
+                value, digit = divmod(value, self._radix)
+                digits.append(digit)
+            return digits
+        half = count // 2
+        high, low = divmod(value, self._power(half))
+        return self._to_digits(low, half) + self._to_digits(high, count - half)
+
+    def _from_digits(self, digits: List[int]) -> int:
+        if len(digits) <= _DIRECT_DIGITS:
+            value = 0
+            for digit in reversed(digits):
+                value = value * self._radix + digit
+            return value
+        half = len(digits) // 2
+        return self._from_digits(digits[:half]) + self._from_digits(digits[half:]) * self._power(half)
+
+    def _encode_digits(self, digits: List[int]) -> bytes:
+        if self._radix <= 256:
+            return bytes(digits)
+        return b''.join(digit.to_bytes(4, 'little') for digit in digits)
+
+    def _keystream(self, label: bytes, data: bytes, count: int) -> List[int]:
+        seed = hashlib.blake2b(label + data, key=self._key).digest()
+        stream = hashlib.shake_256(seed).digest(4 * count)
+        radix = self._radix
+        return [int.from_bytes(stream[i:i + 4], 'little') % radix for i in range(0, 4 * count, 4)]
+
+    def _round_function(self, round_number: int, half: List[int], count: int) -> List[int]:
+        return self._keystream(bytes([round_number]), self._encode_digits(half), count)
+
+    def _permute(self, digits: List[int]) -> List[int]:
+        radix = self._radix
+        split = len(digits) // 2
+        left, right = digits[:split], digits[split:]
+        for round_number in range(FEISTEL_ROUNDS):
+            mask = self._round_function(round_number, right, len(left))
+            left, right = right, [(a + b) % radix for a, b in zip(left, mask)]
+        return left + right
+
+    def _unpermute(self, digits: List[int]) -> List[int]:
+        radix = self._radix
+        split = len(digits) - len(digits) // 2 if FEISTEL_ROUNDS % 2 else len(digits) // 2
+        left, right = digits[:split], digits[split:]
+        for round_number in reversed(range(FEISTEL_ROUNDS)):
+            mask = self._round_function(round_number, left, len(right))
+            left, right = [(a - b) % radix for a, b in zip(right, mask)], left
+        return left + right
+
+    def _tokenize(self, text: str) -> List[int]:
+        if self._single_code_points:
+            try:
+                return [self._symbol_index[char] for char in text]
+            except KeyError as error:
+                raise ValueError(f"Character {error.args[0]!r} is not in the library alphabet") from None
+        digits, position = [], 0
+        while position < len(text):
+            for size in range(min(self._max_symbol_length, len(text) - position), 0, -1):
+                index = self._symbol_index.get(text[position:position + size])
+                if index is not None:
+                    digits.append(index)
+                    position += size
+                    break
+            else:
+                raise ValueError(f"Text at position {position} is not in the library alphabet")
+        return digits
+
+    def _page_digits(self, coordinates) -> List[int]:
+        if not self._radix:
+            raise IndexError('Cannot choose from an empty sequence')
+        number = coordinates_to_number(coordinates) % self._capacity
+        return self._permute(self._to_digits(number, self._page_length))
+
+    def generate_page_content(self, coordinates) -> str:
+        return ''.join([self._symbols[digit] for digit in self._page_digits(coordinates)])
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        char_index = self._symbol_char_index
+        digits = self._page_digits(coordinates)
+        for start in range(0, len(digits), chunk_size):
+            yield [char_index[digit] for digit in digits[start:start + chunk_size]]
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        content = self.generate_page_content(coordinates)
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+
+    def _page_symbol_count(self, coordinates) -> int:
+        return self._page_length
+
+    def iter_page_lengths(self, coordinates):
+        if not self._single_chars:
+            yield from super().iter_page_lengths(coordinates)
+            return
+        for _ in coordinates:
+            yield self._page_length
+
+    def locate_page_content(self, text: str, offset: int = 0) -> Tuple[LibraryCoordinates, int]:
+        """Return (coordinates, offset) of a page holding ``text`` at ``offset``."""
+        digits = self._tokenize(text)
+        if offset < 0 or offset + len(digits) > self._page_length:
+            raise ValueError(f"Text does not fit on a page of {self._page_length} symbols at offset {offset}")
+        # The rest of the page is filled with a deterministic, text-dependent
+        # pattern so that located pages look like any other page.
+        page = self._keystream(b'fill', text.encode(), self._page_length)
+        page[offset:offset + len(digits)] = digits
+        number = self._from_digits(self._unpermute(page))
+        return number_to_coordinates(number), offset
@@ -5,20 +5,25 @@
 # --------------------------------------------------------
 # https://github.com/smartlegionlab
 # --------------------------------------------------------
-import json
-
-from smart_babylon_library.library.coordinates import LibraryCoordinates
-from smart_babylon_library.library.generator import DeterministicGenerator
+from smart_babylon_library.library.coordinates import LibraryCoordinates, coordinate_text
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE, coordinate_values
+from smart_babylon_library.library.registry import get_generator
 from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.packed import decode_page, encode_page, encode_page_indices, get_codec
+from smart_babylon_library.library.serialization import book_record, page_record, write_page_record
+from smart_babylon_library.library.stats import PageStats, page_stats
+
+DEFAULT_LENGTH_BATCH = 1024
 
 
 class LibraryBook:
-    def __init__(self, coordinates, config: LibraryConfig = None):
+    def __init__(self, coordinates, config: LibraryConfig = None, generator=None):
         self.coordinates = coordinates
         self.config = config or LibraryConfig()
-        self._generator = DeterministicGenerator(self.config)
+        self._generator = generator or get_generator(self.config)
         self._title = None
         self._max_pages = None
+        self._total_chars = None
 
     @property
     def title(self) -> str:
@@ -32,6 +37,22 @@ class LibraryBook:
             self._max_pages = self._generator.get_max_pages_for_book(self.coordinates)
         return self._max_pages
 
+    def page_lengths(self, batch_size: int = DEFAULT_LENGTH_BATCH):
+        """Lazily yield lists of page lengths in characters, in page order, without generating content."""
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+        base = (self.coordinates.floor, self.coordinates.room, self.coordinates.cabinet,
+                self.coordinates.shelf, self.coordinates.book)
+        for start in range(0, self.max_pages, batch_size):
+            pages = range(start, min(start + batch_size, self.max_pages))
+            yield list(self._generator.iter_page_lengths(base + (page,) for page in pages))
+
+    @property
+    def total_chars(self) -> int:
+        if self._total_chars is None:
+            self._total_chars = sum(sum(batch) for batch in self.page_lengths())
+        return self._total_chars
+
     def get_page(self, page_number: int):
         if page_number < 0:
             raise ValueError("Page number must be non-negative")
@@ -43,7 +64,7 @@ class LibraryBook:
             self.coordinates.cabinet, self.coordinates.shelf,
             self.coordinates.book, page_number
         )
-        return LibraryPage(page_coordinates, self.config)
+        return LibraryPage(page_coordinates, self.config, self._generator)
 
     def to_dict(self) -> dict:
         return {
@@ -53,12 +74,14 @@ class LibraryBook:
             'page_count': self.max_pages
         }
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+    def to_json(self, fmt: str = None) -> str:
+        """Encode as 'pretty', 'compact' or 'jsonl' JSON; defaults to ``config.json_format``."""
+        return book_record(self.config.universe, coordinate_values(self.coordinates), self.title,
+                           self.max_pages, fmt or self.config.json_format)
 
-    def get_page_json(self, page_number: int) -> str:
+    def get_page_json(self, page_number: int, fmt: str = None) -> str:
         page = self.get_page(page_number)
-        return page.to_json()
+        return page.to_json(fmt)
 
     def __str__(self):
         title = self.title[:30] + '...' if len(self.title) > 30 else self.title
@@ -66,11 +89,12 @@ class LibraryBook:
 
 
 class LibraryPage:
-    def __init__(self, coordinates, config: LibraryConfig = None):
+    def __init__(self, coordinates, config: LibraryConfig = None, generator=None):
         self.coordinates = coordinates
         self.config = config or LibraryConfig()
-        self._generator = DeterministicGenerator(self.config)
+        self._generator = generator or get_generator(self.config)
         self._content = None
+        self._length = None
 
     @property
     def content(self) -> str:
@@ -78,6 +102,31 @@ class LibraryPage:
             self._content = self._generator.generate_page_content(self.coordinates)
         return self._content
 
+    @property
+    def length(self) -> int:
+        if self._content is not None:
+            return len(self._content)
+        if self._length is None:
+            self._length = self._generator.get_page_length(self.coordinates)
+        return self._length
+
+    def read(self, offset: int, length: int) -> str:
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        if length < 0:
+            raise ValueError("Length must be non-negative")
+        if self._content is not None:
+            return self._content[offset:offset + length]
+        return self._generator.read_page_content(self.coordinates, offset, length)
+
+    def verify(self, text: str, offset: int = 0) -> bool:
+        """True when the page holds ``text`` at ``offset``, without generating more than needed."""
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        if self._content is not None:
+            return self._content.startswith(text, offset) and offset <= len(self._content)
+        return self._generator.verify_page_content(self.coordinates, text, offset)
+
     @property
     def page_number(self) -> int:
         return self.coordinates.page
@@ -90,9 +139,55 @@ class LibraryPage:
             'content': self.content
         }
 
-    def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+    def to_json(self, fmt: str = None) -> str:
+        """Encode as 'pretty', 'compact' or 'jsonl' JSON; defaults to ``config.json_format``."""
+        return page_record(self.config.universe, coordinate_values(self.coordinates), self.content,
+                           fmt or self.config.json_format)
+
+    def stats(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PageStats:
+        """Symbol, category and run statistics computed from the index stream, without the text."""
+        return page_stats(self._generator, self.coordinates, chunk_size)
+
+    def to_bytes(self) -> bytes:
+        """Packed binary document; see smart_babylon_library.library.packed."""
+        values = coordinate_values(self.coordinates)
+        if get_codec(self.config).single_code_points:
+            return encode_page(self.config, values, self.content)
+        # Symbols of several code points are packed from the index stream, never re-tokenized.
+        return encode_page_indices(self.config, values, self._generator.iter_page_indices(values))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, config: LibraryConfig = None, generator=None) -> 'LibraryPage':
+        config = config or LibraryConfig()
+        values, content = decode_page(config, data)
+        page = cls(LibraryCoordinates(*values), config, generator)
+        page._content = content
+        return page
+
+    def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        if self._content is not None:
+            for start in range(0, len(self._content), chunk_size):
+                yield self._content[start:start + chunk_size]
+            return
+        yield from self._generator.iter_page_content(self.coordinates, chunk_size)
+
+    def write_to(self, fp, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        written = 0
+        for chunk in self.iter_chunks(chunk_size):
+            fp.write(chunk)
+            written += len(chunk)
+        return written
+
+    def write_json_to(self, fp, chunk_size: int = DEFAULT_CHUNK_SIZE, fmt: str = None) -> int:
+        # Streams exactly the text of to_json(fmt) without building the content string.
+        return write_page_record(fp, self.config.universe, coordinate_values(self.coordinates),
+                                 self.iter_chunks(chunk_size), fmt or self.config.json_format)
+
+    def __len__(self) -> int:
+        return self.length
 
     def __str__(self):
         content_preview = self.content[:50] + '...' if len(self.content) > 50 else self.content
-        return f"Page {self.page_number} (Universe: {self.config.universe}): {content_preview}"
+        return f"Page {coordinate_text(self.page_number)} (Universe: {self.config.universe}): {content_preview}"
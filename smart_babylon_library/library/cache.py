@@ -0,0 +1,171 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE, coordinate_values
+
+DEFAULT_CACHE_BYTES = 64 * 1024 * 1024
+_ENTRY_OVERHEAD = 200
+
+
+@dataclass
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data['hit_rate'] = self.hit_rate
+        return data
+
+
+class ContentCache:
+    """Thread-safe LRU cache evicting by an approximate byte budget."""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        if max_bytes < 1:
+            raise ValueError("Cache size must be positive")
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(key, value) -> int:
+        return sys.getsizeof(value) + sys.getsizeof(key) + _ENTRY_OVERHEAD
+
+    def get(self, key):
+        return self._lookup(key, True)
+
+    def peek(self, key):
+        """Like get() without counting a hit or miss, for opportunistic probes."""
+        return self._lookup(key, False)
+
+    def _lookup(self, key, count: bool):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if count:
+                    self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if count:
+                self._hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions,
+                              len(self._entries), self._size, self.max_bytes)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _coordinates_key(coordinates) -> tuple:
+    # The full 6-tuple even for book entries: legacy title and page-count seeds
+    # include the page component.
+    return coordinate_values(coordinates)
+
+
+class CachingGenerator:
+    """
+    Wraps a compiled generator with a shared cache keyed by
+    (config fingerprint, kind, coordinates). Other attributes are delegated.
+    """
+
+    def __init__(self, generator, cache: ContentCache):
+        self._generator = generator
+        self.cache = cache
+
+    def __getattr__(self, name):
+        return getattr(self._generator, name)
+
+    def _cached(self, kind: str, coordinates_key: tuple, produce):
+        key = (self._generator.fingerprint, kind, coordinates_key)
+        value = self.cache.get(key)
+        if value is None:
+            value = produce()
+            self.cache.put(key, value)
+        return value
+
+    def _cached_content(self, coordinates):
+        return self.cache.peek((self._generator.fingerprint, 'content', _coordinates_key(coordinates)))
+
+    def generate_book_title(self, coordinates) -> str:
+        return self._cached('title', _coordinates_key(coordinates),
+                            lambda: self._generator.generate_book_title(coordinates))
+
+    def get_max_pages_for_book(self, coordinates) -> int:
+        return self._cached('pages', _coordinates_key(coordinates),
+                            lambda: self._generator.get_max_pages_for_book(coordinates))
+
+    def generate_page_content(self, coordinates) -> str:
+        return self._cached('content', _coordinates_key(coordinates),
+                            lambda: self._generator.generate_page_content(coordinates))
+
+    def get_page_length(self, coordinates) -> int:
+        content = self._cached_content(coordinates)
+        if content is not None:
+            return len(content)
+        return self._generator.get_page_length(coordinates)
+
+    def read_page_content(self, coordinates, offset: int, length: int) -> str:
+        content = self._cached_content(coordinates)
+        if content is not None:
+            return content[offset:offset + length]
+        return self._generator.read_page_content(coordinates, offset, length)
+
+    def verify_page_content(self, coordinates, text: str, offset: int = 0) -> bool:
+        content = self._cached_content(coordinates)
+        if content is None:
+            return self._generator.verify_page_content(coordinates, text, offset)
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        return content.startswith(text, offset) and offset <= len(content)
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        content = self._cached_content(coordinates)
+        if content is None:
+            return self._generator.iter_page_content(coordinates, chunk_size)
+        return (content[start:start + chunk_size] for start in range(0, len(content), chunk_size))
@@ -0,0 +1,42 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+from typing import Iterator, List, NamedTuple
+
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.region import iter_book_coordinates
+
+DEFAULT_CATALOG_BATCH = 256
+
+
+class CatalogRecord(NamedTuple):
+    coordinates: LibraryCoordinates
+    title: str
+    page_count: int
+
+    def to_dict(self) -> dict:
+        return {
+            'coordinates': self.coordinates.to_dict(),
+            'title': self.title,
+            'page_count': self.page_count
+        }
+
+
+def build_catalog(generator, floor, room, cabinet, shelf, book,
+                  batch_size: int = DEFAULT_CATALOG_BATCH) -> Iterator[List[CatalogRecord]]:
+    """Lazily yield batches of catalog records for a region of books."""
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive")
+    batch = []
+    for values, title, page_count in generator.iter_book_metadata(
+            iter_book_coordinates(floor, room, cabinet, shelf, book)):
+        batch.append(CatalogRecord(LibraryCoordinates(*values), title, page_count))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
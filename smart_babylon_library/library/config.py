@@ -12,6 +12,9 @@ from smart_babylon_library.character_sets.alphabets import CyrillicAlphabet, Lat
 from smart_babylon_library.character_sets.digits import Digits
 from smart_babylon_library.character_sets.punctuation import Punctuation
 
+SUPPORTED_ENGINES = ('legacy', 'numpy-v1', 'seekable-v1', 'bijective-v1')
+JSON_FORMATS = ('pretty', 'compact', 'jsonl')
+
 
 @dataclass
 class LibraryConfig:
@@ -20,6 +23,8 @@ class LibraryConfig:
     content_length_range: Tuple[int, int] = (1, 50000)
     pages_per_book_range: Tuple[int, int] = (1, 15784)
     character_sets: Optional[List[CharacterSet]] = None
+    engine: str = "legacy"
+    json_format: str = "pretty"
 
     def __post_init__(self):
         if not isinstance(self.universe, str):
@@ -30,6 +35,10 @@ class LibraryConfig:
             raise ValueError("Invalid content_length_range")
         if self.pages_per_book_range[0] < 1 or self.pages_per_book_range[1] < self.pages_per_book_range[0]:
             raise ValueError("Invalid pages_per_book_range")
+        if self.engine not in SUPPORTED_ENGINES:
+            raise ValueError(f"Unknown engine '{self.engine}', expected one of {', '.join(SUPPORTED_ENGINES)}")
+        if self.json_format not in JSON_FORMATS:
+            raise ValueError(f"Unknown JSON format '{self.json_format}', expected one of {', '.join(JSON_FORMATS)}")
 
         if self.character_sets is None:
             self.character_sets = [
@@ -0,0 +1,178 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Conformance corpus for the legacy generation algorithm.
+
+Compares AcceleratedGenerator against the reference DeterministicGenerator
+over many universes, coordinates and character sets, and checks both against
+golden digests recorded from the reference implementation.
+
+Run with: python -m smart_babylon_library.library.conformance
+"""
+import hashlib
+import sys
+from typing import List, Tuple
+
+from smart_babylon_library.character_sets.alphabets import CyrillicAlphabet, LatinAlphabet
+from smart_babylon_library.character_sets.core import CharacterSet
+from smart_babylon_library.character_sets.digits import Digits
+from smart_babylon_library.character_sets.punctuation import Punctuation
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.generator import AcceleratedGenerator, DeterministicGenerator
+
+
+class _SingleCharacterSet(CharacterSet):
+    @property
+    def characters(self):
+        return ['x']
+
+    @property
+    def name(self) -> str:
+        return "Single character"
+
+
+class _WideCharacterSet(CharacterSet):
+    """More than 256 symbols, exercising the word-level rejection path."""
+
+    @property
+    def characters(self):
+        return [chr(code) for code in range(0x4E00, 0x4E00 + 300)]
+
+    @property
+    def name(self) -> str:
+        return "CJK block sample"
+
+
+class _MultiCodePointCharacterSet(CharacterSet):
+    @property
+    def characters(self):
+        return sorted(['☺️', '👍🏽', 'ab', 'é', '!'])
+
+    @property
+    def name(self) -> str:
+        return "Multi code point symbols"
+
+
+CHARACTER_SET_CASES = {
+    'default': None,
+    'latin_digits': lambda: [LatinAlphabet(), Digits()],
+    'digits': lambda: [Digits()],
+    'cyrillic_punctuation': lambda: [CyrillicAlphabet(), Punctuation()],
+    'single': lambda: [_SingleCharacterSet()],
+    'wide': lambda: [_WideCharacterSet(), LatinAlphabet()],
+    'multi_code_point': lambda: [_MultiCodePointCharacterSet(), Digits()],
+}
+
+UNIVERSES = ('default', 'middle_earth', 'andromeda_galaxy', '')
+
+COORDINATES = (
+    (0, 0, 0, 0, 0, 0),
+    (1, 3, 2, 5, 42, 0),
+    (1, 3, 2, 5, 42, 7),
+    (7, 7, 7, 7, 7, 7),
+    (12, 0, 4, 1, 99, 1023),
+    (123456789, 987654321, 5, 3, 1, 15783),
+)
+
+# sha256 over the reference output of every (universe, character set) case.
+GOLDEN_DIGESTS = {
+    ('default', 'default'): '3cd6c88183ebece3da22569c4fdd8a7c5bf66517e51a5bba80b42977e4ddd8cf',
+    ('default', 'latin_digits'): '576ba2d8bdc4f339de714e318747680253320c1f09b298d7444f9eebfd3366f4',
+    ('default', 'digits'): '96a65b2cbee2aa924b39c2161b04c5bc961981fc7cc0c96471ec0d2b1597818f',
+    ('default', 'cyrillic_punctuation'): 'fba8e5658655cddd1b8f5a8906fc7434f3695ceaeac3ca261d6e47eb106dbe58',
+    ('default', 'single'): '3a9a7a171ba60064d5c8cebde225fb9c31b7b3b0d11d2a9c6d12c074e8372b4e',
+    ('default', 'wide'): '44224dd07c88317ab8dd5e104b0b5fdaeade39522b9d4f8d3294519042fb60f3',
+    ('default', 'multi_code_point'): '5cac39054d3047b4b76f9c2ad660c1ff76a0a5e9b5b25bb643fe7484ca77e3a6',
+    ('middle_earth', 'default'): '1be311dea74fd6749ca29056771d159b9f8fc61541614e8dfa8409ea1bebc470',
+    ('middle_earth', 'latin_digits'): '8558cd83af36d90b7127962e5b4c8445539a978dbc58449c361361470259aa35',
+    ('middle_earth', 'digits'): 'd2744eb79700eabe55dd43cc399230c976257b1bd62cffe10e99712bb82a1cc7',
+    ('middle_earth', 'cyrillic_punctuation'): 'a94bca5f9cc200a48058ef0a7d21a8df454be001ef5a99d64f8e1f9e1bc66eab',
+    ('middle_earth', 'single'): '601f8afb4980e39585840a57211c6b6cad390a6eeddcb94dccf4ad0dc777a020',
+    ('middle_earth', 'wide'): '7e8efac25a9b7ca01f742a61b8f5fd33e2f5005249550704a7638bdc53f45e07',
+    ('middle_earth', 'multi_code_point'): 'f2d6aa3b3fb0e416ec0f9faa4c9f309947d04bead9b4643e402efd077d3b4884',
+    ('andromeda_galaxy', 'default'): '23f119c684da0ea0be44e6c7715034bcc54af072c33a4395cc6886a3a807fac2',
+    ('andromeda_galaxy', 'latin_digits'): '0f4df88e91c162892c4431c5e908bdc1401c23eb9a0711d8fe378eadf9d73d98',
+    ('andromeda_galaxy', 'digits'): '433902fc8d965fcdf4e2dc913c6a75b84e94983808ce0caa92199a364ed0661a',
+    ('andromeda_galaxy', 'cyrillic_punctuation'): 'ecc6cab0e66539193774a033febdd0f6cb73171894e1124bbeeac4590d3f16c4',
+    ('andromeda_galaxy', 'single'): '997d7333242aa0ba7eae40cc6b29270a19579b625c6f029b476a4b2ee17128c7',
+    ('andromeda_galaxy', 'wide'): 'f26ad70928294a2738d81e5769a86f4f40d55a8fc8bb31fd378c69d930b12542',
+    ('andromeda_galaxy', 'multi_code_point'): 'df04e93330c84d76f87fdb7c2687d99261daf19148ae69ad6170e235c57f0e7b',
+    ('', 'default'): 'd19c91eb45cfb5f881561c01ee7c85a6c6cab9fded7ea82e850662b39df5abfd',
+    ('', 'latin_digits'): '5bd6c9379c62830f565306771eea9b9038be0d1158e004d9d567d5d1c9cfdd16',
+    ('', 'digits'): 'a7d741aa7828dd89fa6c36eb7b660526aeedf7d427e1f3f8de1ff1a1eb4a3f37',
+    ('', 'cyrillic_punctuation'): '13875c807d3eef5b9b5bd97bff500fa71f288dc27b90ce764a186b49e648ba82',
+    ('', 'single'): '35765837c26daf4834319b4e86e28e1f75ba11f0749b4cf25f2af1530a786e58',
+    ('', 'wide'): 'e5d19e496e0dcd84c934e8e07ac92fc2601e695a0e23d0605a9f022608f7d378',
+    ('', 'multi_code_point'): '656f16127330c790eb68766ab0b68994bccee3f18e3318ad082ff9386d20ce14',
+}
+
+
+def _make_config(universe: str, character_set_case: str) -> LibraryConfig:
+    factory = CHARACTER_SET_CASES[character_set_case]
+    return LibraryConfig(
+        universe=universe,
+        title_length_range=(2, 300),
+        content_length_range=(1, 5000),
+        pages_per_book_range=(1, 15784),
+        character_sets=factory() if factory else None,
+    )
+
+
+def iter_cases():
+    for universe in UNIVERSES:
+        for character_set_case in CHARACTER_SET_CASES:
+            yield universe, character_set_case
+
+
+def _case_outputs(generator: DeterministicGenerator):
+    for values in COORDINATES:
+        coordinates = LibraryCoordinates(*values)
+        yield 'title', values, generator.generate_book_title(coordinates)
+        yield 'pages', values, str(generator.get_max_pages_for_book(coordinates))
+        yield 'content', values, generator.generate_page_content(coordinates)
+
+
+def case_digest(generator: DeterministicGenerator) -> str:
+    digest = hashlib.sha256()
+    for kind, values, output in _case_outputs(generator):
+        digest.update(f"{kind}:{values}:{output}\n".encode())
+    return digest.hexdigest()
+
+
+def check_conformance() -> List[Tuple[str, str, str]]:
+    """Return a list of (case, check, detail) failures; empty means conformant."""
+    failures = []
+    for universe, character_set_case in iter_cases():
+        case = f"{universe!r}/{character_set_case}"
+        config = _make_config(universe, character_set_case)
+        reference = DeterministicGenerator(config)
+        accelerated = AcceleratedGenerator(config)
+        for (kind, values, expected), (_, _, actual) in zip(_case_outputs(reference),
+                                                            _case_outputs(accelerated)):
+            if expected != actual:
+                failures.append((case, kind, f"mismatch at {values}"))
+        golden = GOLDEN_DIGESTS.get((universe, character_set_case))
+        if golden is None:
+            failures.append((case, 'golden', 'no golden digest recorded'))
+        elif case_digest(accelerated) != golden:
+            failures.append((case, 'golden', 'digest differs from recorded reference output'))
+    return failures
+
+
+def main() -> int:
+    failures = check_conformance()
+    for case, check, detail in failures:
+        print(f"FAIL {case} [{check}]: {detail}")
+    total = len(UNIVERSES) * len(CHARACTER_SET_CASES)
+    print(f"{total - len({case for case, _, _ in failures})}/{total} cases conformant")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
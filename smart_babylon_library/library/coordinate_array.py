@@ -0,0 +1,126 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import itertools
+from array import array
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+
+_AXES = ('floor', 'room', 'cabinet', 'shelf', 'book', 'page')
+DEFAULT_PACK_WIDTHS = (32, 32, 32, 32, 32, 32)
+
+
+def _axis_values(value) -> Sequence[int]:
+    if isinstance(value, int):
+        return (value,)
+    return value if isinstance(value, range) else tuple(value)
+
+
+def _shifts(widths: Tuple[int, ...]) -> List[int]:
+    return [sum(widths[index + 1:]) for index in range(len(widths))]
+
+
+class CoordinateArray:
+    """
+    Columnar page coordinates: six int64 columns validated as a whole.
+
+    Iterating yields plain 6-tuples, which every generator and batch API
+    accepts, so large sweeps never build per-item LibraryCoordinates.
+    """
+
+    __slots__ = ('_columns',)
+
+    def __init__(self, floor: Iterable[int] = (), room: Iterable[int] = (), cabinet: Iterable[int] = (),
+                 shelf: Iterable[int] = (), book: Iterable[int] = (), page: Iterable[int] = ()):
+        columns = tuple(value if isinstance(value, array) and value.typecode == 'q' else array('q', value)
+                        for value in (floor, room, cabinet, shelf, book, page))
+        self._columns = self._validate(columns)
+
+    @staticmethod
+    def _validate(columns: tuple) -> tuple:
+        size = len(columns[0])
+        if any(len(column) != size for column in columns):
+            raise ValueError("All coordinate columns must have the same length")
+        if size and min(min(column) for column in columns) < 0:
+            raise ValueError("All coordinates must be non-negative")
+        return columns
+
+    @classmethod
+    def _from_columns(cls, columns: tuple) -> 'CoordinateArray':
+        instance = cls.__new__(cls)
+        instance._columns = columns
+        return instance
+
+    @classmethod
+    def from_ranges(cls, floor=0, room=0, cabinet=0, shelf=0, book=0, page=0) -> 'CoordinateArray':
+        """Cartesian product of the axes (ints, ranges or iterables), last axis varying fastest."""
+        axes = [_axis_values(value) for value in (floor, room, cabinet, shelf, book, page)]
+        sizes = [len(values) for values in axes]
+        columns = []
+        for index, values in enumerate(axes):
+            inner = 1
+            for size in sizes[index + 1:]:
+                inner *= size
+            outer = 1
+            for size in sizes[:index]:
+                outer *= size
+            block = array('q', itertools.chain.from_iterable(itertools.repeat(value, inner) for value in values))
+            columns.append(block * outer)
+        return cls._from_columns(cls._validate(tuple(columns)))
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable) -> 'CoordinateArray':
+        columns = tuple(array('q') for _ in _AXES)
+        for item in coordinates:
+            if isinstance(item, LibraryCoordinates):
+                item = (item.floor, item.room, item.cabinet, item.shelf, item.book, item.page)
+            for column, value in zip(columns, item):
+                column.append(value)
+        return cls._from_columns(cls._validate(columns))
+
+    @classmethod
+    def unpack(cls, keys: Iterable[int], widths: Tuple[int, ...] = DEFAULT_PACK_WIDTHS) -> 'CoordinateArray':
+        keys = keys if isinstance(keys, list) else list(keys)
+        masks = [(1 << width) - 1 for width in widths]
+        columns = tuple(array('q', [(key >> shift) & mask for key in keys])
+                        for shift, mask in zip(_shifts(widths), masks))
+        return cls._from_columns(columns)
+
+    def pack(self, widths: Tuple[int, ...] = DEFAULT_PACK_WIDTHS) -> List[int]:
+        """Pack each row into one integer key, floor in the most significant bits."""
+        if len(widths) != len(_AXES):
+            raise ValueError("Six pack widths are required")
+        if len(self) and any(max(column) >> width for column, width in zip(self._columns, widths)):
+            raise ValueError("Coordinate value does not fit its pack width")
+        shift_floor, shift_room, shift_cabinet, shift_shelf, shift_book, _ = _shifts(widths)
+        return [(floor << shift_floor) | (room << shift_room) | (cabinet << shift_cabinet)
+                | (shelf << shift_shelf) | (book << shift_book) | page
+                for floor, room, cabinet, shelf, book, page in zip(*self._columns)]
+
+    def column(self, name: str) -> array:
+        return self._columns[_AXES.index(name)]
+
+    def iter_tuples(self) -> Iterator[Tuple[int, ...]]:
+        return zip(*self._columns)
+
+    def iter_seeds(self) -> Iterator[str]:
+        return ('%d:%d:%d:%d:%d:%d' % values for values in zip(*self._columns))
+
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        return self.iter_tuples()
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._from_columns(tuple(column[index] for column in self._columns))
+        return LibraryCoordinates(*(column[index] for column in self._columns))
+
+    def __repr__(self) -> str:
+        return f"CoordinateArray(size={len(self)})"
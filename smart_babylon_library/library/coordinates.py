@@ -5,10 +5,52 @@
 # --------------------------------------------------------
 # https://github.com/smartlegionlab
 # --------------------------------------------------------
-from dataclasses import dataclass
+from dataclasses import astuple, dataclass
 from typing import Dict, Any
 import json
 
+# Coordinates wider than this (about 2466 digits, e.g. pages located by the
+# bijective engine) are written as '0x' hex strings in JSON, seeds and text:
+# Python 3.11+ refuses decimal conversion of ints past 4300 digits, hex is exempt.
+LARGE_COORDINATE_BITS = 8192
+# Fewer digits than this means no component can be large.
+_LARGE_DIGITS = int(LARGE_COORDINATE_BITS * 0.30103)
+
+
+def coordinate_text(value: int) -> str:
+    """Decimal text of a coordinate, or '0x' hex past ``LARGE_COORDINATE_BITS`` bits."""
+    return str(value) if value.bit_length() <= LARGE_COORDINATE_BITS else hex(value)
+
+
+def seed_text(values: tuple) -> str:
+    """``floor:room:cabinet:shelf:book:page`` with each component as coordinate_text."""
+    try:
+        text = '%d:%d:%d:%d:%d:%d' % values
+        if len(text) <= _LARGE_DIGITS:
+            return text
+    except ValueError:
+        pass
+    return ':'.join(map(coordinate_text, values))
+
+
+def encode_coordinate(value: int):
+    """JSON value of a coordinate: the int itself, or its '0x' hex string when it is large."""
+    return value if value.bit_length() <= LARGE_COORDINATE_BITS else hex(value)
+
+
+def parse_coordinate(text: str) -> int:
+    """Read coordinate_text back: decimal, or '0x' hex."""
+    return int(text, 16) if text.startswith('0x') else int(text)
+
+
+def decode_coordinate(value) -> int:
+    """Inverse of encode_coordinate; also accepts plain ints of any size."""
+    if isinstance(value, str):
+        if not value.startswith('0x'):
+            raise ValueError(f"Coordinate strings must be '0x' hex, got {value[:20]!r}")
+        return parse_coordinate(value)
+    return value
+
 @dataclass(frozen=True)
 class LibraryCoordinates:
     floor: int
@@ -24,7 +66,7 @@ class LibraryCoordinates:
 
     @property
     def seed(self) -> str:
-        return f"{self.floor}:{self.room}:{self.cabinet}:{self.shelf}:{self.book}:{self.page}"
+        return seed_text((self.floor, self.room, self.cabinet, self.shelf, self.book, self.page))
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -37,17 +79,18 @@ class LibraryCoordinates:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+        data = {key: encode_coordinate(value) for key, value in self.to_dict().items()}
+        return json.dumps(data, ensure_ascii=False, indent=2)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'LibraryCoordinates':
         return cls(
-            floor=data['floor'],
-            room=data['room'],
-            cabinet=data['cabinet'],
-            shelf=data['shelf'],
-            book=data['book'],
-            page=data['page']
+            floor=decode_coordinate(data['floor']),
+            room=decode_coordinate(data['room']),
+            cabinet=decode_coordinate(data['cabinet']),
+            shelf=decode_coordinate(data['shelf']),
+            book=decode_coordinate(data['book']),
+            page=decode_coordinate(data['page'])
         )
 
     @classmethod
@@ -55,5 +98,5 @@ class LibraryCoordinates:
         return cls.from_dict(json.loads(json_str))
 
     def __str__(self):
-        return (f"Floor{self.floor}/Room{self.room}/Cabinet{self.cabinet}/"
-                f"Shelf{self.shelf}/Book{self.book}/Page{self.page}")
+        floor, room, cabinet, shelf, book, page = map(coordinate_text, astuple(self))
+        return f"Floor{floor}/Room{room}/Cabinet{cabinet}/Shelf{shelf}/Book{book}/Page{page}"
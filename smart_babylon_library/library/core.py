@@ -5,35 +5,273 @@
 # --------------------------------------------------------
 # https://github.com/smartlegionlab
 # --------------------------------------------------------
+import copy
+import time
+
 from smart_babylon_library.library.book import LibraryBook, LibraryPage
+from smart_babylon_library.library.cache import CachingGenerator, ContentCache
+from smart_babylon_library.library.catalog import DEFAULT_CATALOG_BATCH, build_catalog
 from smart_babylon_library.library.coordinates import LibraryCoordinates
 from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.instrumentation import (
+    InstrumentedGenerator, Instrumentation, instrument_seeding
+)
+from smart_babylon_library.library.packed import PackedPageWriter, get_codec, iter_packed_records
+from smart_babylon_library.library.parallel import (
+    coordinate_tuples, generate_book_metadata, generate_book_metadata_in_universe, generate_page,
+    generate_page_in_universe, generate_page_indices, parallel_map, verify_page
+)
+from smart_babylon_library.library.region import iter_book_coordinates, iter_page_coordinates
+from smart_babylon_library.library.registry import config_fingerprint, get_generator, get_universe_generator
+from smart_babylon_library.library.scanner import scan
+from smart_babylon_library.library.serialization import write_book_records, write_page_records
+from smart_babylon_library.library.shard import Shard, ShardedGenerator, materialize
+from smart_babylon_library.library.stats import PageStats, merge_stats, page_stats
 
 
 class SmartBabylonLibrary:
-    def __init__(self, config: LibraryConfig = None):
+    def __init__(self, config: LibraryConfig = None, cache: ContentCache = None):
         self.config = config or LibraryConfig()
+        self.cache = cache
+        self._instrumentation = None
+        self._shards = []
+        self._build_generator()
+
+    def _build_generator(self):
+        self._fingerprint = config_fingerprint(self.config)
+        generator = get_generator(self.config)
+        if self._instrumentation is not None:
+            generator = instrument_seeding(generator, self._instrumentation)
+        if self.cache is not None:
+            generator = CachingGenerator(generator, self.cache)
+        # Shards written for another configuration stay mounted but unused until it is restored.
+        shards = tuple(shard for shard in self._shards if shard.fingerprint == self._fingerprint)
+        if shards:
+            generator = ShardedGenerator(generator, shards)
+        if self._instrumentation is not None:
+            generator = InstrumentedGenerator(generator, self._instrumentation)
+        self._generator = generator
+
+    @property
+    def generator(self):
+        # ``config`` may be replaced or changed in place; generation follows it.
+        if config_fingerprint(self.config) != self._fingerprint:
+            self._build_generator()
+        return self._generator
+
+    @property
+    def instrumentation(self):
+        return self._instrumentation
+
+    def enable_instrumentation(self, instrumentation: Instrumentation = None) -> Instrumentation:
+        """Start timing generation; affects books and pages created afterwards."""
+        self._instrumentation = instrumentation or self._instrumentation or Instrumentation()
+        self._build_generator()
+        return self._instrumentation
+
+    def disable_instrumentation(self):
+        self._instrumentation = None
+        self._build_generator()
+
+    @property
+    def shards(self) -> tuple:
+        return tuple(self._shards)
+
+    def materialize(self, coordinates, path, workers: int = None) -> int:
+        """Precompute the pages for ``coordinates`` into a shard file; returns the page count."""
+        return materialize(self.config, coordinates, path, workers=workers, generator=self.generator)
+
+    def mount_shard(self, path) -> Shard:
+        """Serve the pages of a materialized shard from a memory map; others are still generated."""
+        shard = Shard(path, self.config)
+        self._shards.append(shard)
+        self._build_generator()
+        return shard
+
+    def unmount_shard(self, shard: Shard):
+        self._shards.remove(shard)
+        self._build_generator()
+        shard.close()
 
     def get_book(self, floor: int, room: int, cabinet: int, shelf: int, book_number: int):
         coordinates = LibraryCoordinates(floor, room, cabinet, shelf, book_number, 0)
-        return LibraryBook(coordinates, self.config)
+        return LibraryBook(coordinates, self.config, self.generator)
 
     def get_book_from_dict(self, coordinates_dict: dict):
         coordinates = LibraryCoordinates.from_dict(coordinates_dict)
-        return LibraryBook(coordinates, self.config)
+        return LibraryBook(coordinates, self.config, self.generator)
 
-    def get_book_json(self, coordinates_dict: dict) -> str:
+    def get_book_json(self, coordinates_dict: dict, fmt: str = None) -> str:
         book = self.get_book_from_dict(coordinates_dict)
-        return book.to_json()
+        return self._to_json(book, fmt)
 
     def get_page(self, floor: int, room: int, cabinet: int, shelf: int, book_number: int, page: int):
         coordinates = LibraryCoordinates(floor, room, cabinet, shelf, book_number, page)
-        return LibraryPage(coordinates, self.config)
+        return LibraryPage(coordinates, self.config, self.generator)
 
     def get_page_from_dict(self, coordinates_dict: dict):
         coordinates = LibraryCoordinates.from_dict(coordinates_dict)
-        return LibraryPage(coordinates, self.config)
+        return LibraryPage(coordinates, self.config, self.generator)
 
-    def get_page_json(self, coordinates_dict: dict) -> str:
+    def get_page_from_bytes(self, data: bytes):
+        return LibraryPage.from_bytes(data, self.config, self.generator)
+
+    def get_page_json(self, coordinates_dict: dict, fmt: str = None) -> str:
         page = self.get_page_from_dict(coordinates_dict)
-        return page.to_json()
+        return self._to_json(page, fmt)
+
+    def _to_json(self, item, fmt: str = None) -> str:
+        if self._instrumentation is None:
+            return item.to_json(fmt)
+        if isinstance(item, LibraryPage):
+            item.content
+        else:
+            item.title, item.max_pages
+        started = time.perf_counter()
+        text = item.to_json(fmt)
+        self._instrumentation.record('json', time.perf_counter() - started, len(text))
+        return text
+
+    def locate(self, text: str, offset: int = 0):
+        """Return (coordinates, offset) of a page containing ``text``; needs the 'bijective-v1' engine."""
+        if not hasattr(self.generator, 'locate_page_content'):
+            raise ValueError(f"Engine '{self.config.engine}' cannot locate text, use 'bijective-v1'")
+        return self.generator.locate_page_content(text, offset)
+
+    def verify(self, coordinates, text: str, offset: int = 0) -> bool:
+        """True when the page at ``coordinates`` holds ``text`` at ``offset``; stops at the first mismatch."""
+        return self.generator.verify_page_content(next(coordinate_tuples([coordinates])), text, offset)
+
+    def verify_many(self, items, workers: int = None):
+        """Yield verify() results in order for (coordinates, text) or (coordinates, text, offset) items."""
+        def normalized():
+            for item in items:
+                coordinates, text, *rest = item
+                yield next(coordinate_tuples([coordinates])), text, rest[0] if rest else 0
+
+        for _, result in parallel_map(self.config, verify_page, normalized(), workers=workers,
+                                      generator=self.generator):
+            yield result
+
+    def iter_books(self, floor, room, cabinet, shelf, book):
+        """Lazily yield the books of a region; each axis takes an int, a range or an iterable."""
+        for values in iter_book_coordinates(floor, room, cabinet, shelf, book):
+            yield LibraryBook(LibraryCoordinates(*values), self.config, self.generator)
+
+    def catalog(self, floor, room, cabinet, shelf, book, batch_size: int = DEFAULT_CATALOG_BATCH):
+        """Yield batches of CatalogRecord(coordinates, title, page_count) for a region of books."""
+        return build_catalog(self.generator, floor, room, cabinet, shelf, book, batch_size)
+
+    def iter_page_coordinates(self, floor, room, cabinet, shelf, book, page=None):
+        """Lazily yield page coordinate tuples of a region; ``page=None`` means every page of each book."""
+        return iter_page_coordinates(self.generator, floor, room, cabinet, shelf, book, page)
+
+    def scan(self, coordinates, patterns, workers: int = None, max_hits: int = None):
+        """Scan pages for any of ``patterns``; see smart_babylon_library.library.scanner.scan."""
+        return scan(self, coordinates, patterns, workers=workers, max_hits=max_hits)
+
+    def region_stats(self, floor, room, cabinet, shelf, book, page=None, workers: int = None) -> PageStats:
+        """Merged PageStats of a region; ``page=None`` means every page of each book."""
+        coordinates = iter_page_coordinates(self.generator, floor, room, cabinet, shelf, book, page)
+        results = parallel_map(self.config, page_stats, coordinates, workers=workers, ordered=False,
+                               generator=self.generator)
+        return merge_stats((stats for _, stats in results), self.config)
+
+    def get_pages(self, coordinates, workers: int = None, ordered: bool = True):
+        """Yield pages for an iterable of coordinates, generated across ``workers`` processes."""
+        results = parallel_map(self.config, generate_page, coordinate_tuples(coordinates),
+                               workers=workers, ordered=ordered, generator=self.generator)
+        for values, content in results:
+            page = LibraryPage(LibraryCoordinates(*values), self.config, self.generator)
+            page._content = content
+            yield page
+
+    def get_page_across_universes(self, coordinates, universes, workers: int = None) -> dict:
+        """
+        Generate the page at ``coordinates`` in each of ``universes`` (this configuration
+        with another universe name); returns {universe: page} in the order given.
+        """
+        values = next(coordinate_tuples([coordinates]))
+        generators = {universe: get_universe_generator(self.config, universe) for universe in universes}
+        if workers and workers > 1:
+            results = parallel_map(self.config, generate_page_in_universe,
+                                   [(universe, values) for universe in generators], workers=workers)
+            contents = {universe: content for (universe, _), content in results}
+        else:
+            contents = {universe: generator.generate_page_content(values)
+                        for universe, generator in generators.items()}
+        pages = {}
+        for universe, generator in generators.items():
+            page = LibraryPage(LibraryCoordinates(*values), self._universe_config(universe), generator)
+            page._content = contents[universe]
+            pages[universe] = page
+        return pages
+
+    def _universe_config(self, universe: str) -> LibraryConfig:
+        # Built from this library's config rather than generator.config, which may
+        # belong to another config sharing the fingerprint (e.g. a different json_format).
+        config = copy.copy(self.config)
+        config.universe = universe
+        return config
+
+    def get_book_across_universes(self, coordinates, universes, workers: int = None) -> dict:
+        """Like get_page_across_universes for book titles and page counts; returns {universe: book}."""
+        values = next(coordinate_tuples([coordinates], book=True))
+        generators = {universe: get_universe_generator(self.config, universe) for universe in universes}
+        if workers and workers > 1:
+            results = parallel_map(self.config, generate_book_metadata_in_universe,
+                                   [(universe, values) for universe in generators], workers=workers)
+            metadata = {universe: result for (universe, _), result in results}
+        else:
+            metadata = {universe: generate_book_metadata(generator, values)
+                        for universe, generator in generators.items()}
+        books = {}
+        for universe, generator in generators.items():
+            book = LibraryBook(LibraryCoordinates(*values), self._universe_config(universe), generator)
+            book._title, book._max_pages = metadata[universe]
+            books[universe] = book
+        return books
+
+    def get_books_metadata(self, coordinates, workers: int = None, ordered: bool = True):
+        """Yield book dictionaries (as LibraryBook.to_dict) for an iterable of book coordinates."""
+        results = parallel_map(self.config, generate_book_metadata, coordinate_tuples(coordinates, book=True),
+                               workers=workers, ordered=ordered, generator=self.generator)
+        for values, (title, page_count) in results:
+            yield {
+                'universe': self.config.universe,
+                'coordinates': LibraryCoordinates(*values).to_dict(),
+                'title': title,
+                'page_count': page_count
+            }
+
+    def write_pages_jsonl(self, coordinates, fp, workers: int = None) -> int:
+        """Write pages for an iterable of coordinates to ``fp`` as JSON lines; returns the record count."""
+        results = parallel_map(self.config, generate_page, coordinate_tuples(coordinates), workers=workers,
+                               generator=self.generator)
+        return write_page_records(fp, self.config.universe, results)
+
+    def write_books_jsonl(self, coordinates, fp, workers: int = None) -> int:
+        """Write book records for an iterable of book coordinates to ``fp`` as JSON lines."""
+        results = parallel_map(self.config, generate_book_metadata, coordinate_tuples(coordinates, book=True),
+                               workers=workers, generator=self.generator)
+        return write_book_records(fp, self.config.universe, results)
+
+    def write_packed_pages(self, coordinates, fp, workers: int = None) -> int:
+        """Write pages for an iterable of coordinates to a binary stream as a packed container."""
+        writer = PackedPageWriter(fp, self.config)
+        if get_codec(self.config).single_code_points:
+            task, write = generate_page, writer.write
+        else:
+            # Symbols of several code points are packed from the index stream, never re-tokenized.
+            task, write = generate_page_indices, writer.write_indices
+        for values, result in parallel_map(self.config, task, coordinate_tuples(coordinates),
+                                           workers=workers, generator=self.generator):
+            write(values, result)
+        return writer.pages
+
+    def iter_packed_pages(self, fp):
+        """Yield the pages stored in a packed container written by ``write_packed_pages``."""
+        for values, content in iter_packed_records(fp, self.config):
+            page = LibraryPage(LibraryCoordinates(*values), self.config, self.generator)
+            page._content = content
+            yield page
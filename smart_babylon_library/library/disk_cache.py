@@ -0,0 +1,211 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Persistent content cache shared by processes on one host.
+
+Entries live in a SQLite database in WAL mode, so readers never block each
+other and writers serialize on short ``BEGIN IMMEDIATE`` transactions. Keys are
+the ``(fingerprint, kind, coordinates)`` tuples built by ``CachingGenerator``;
+page content is stored zlib-compressed. The total stored size is kept in the
+database and the least recently used entries are evicted once it exceeds
+``max_bytes``.
+"""
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from smart_babylon_library.library.cache import CacheStats
+from smart_babylon_library.library.coordinates import coordinate_text
+
+DEFAULT_DISK_CACHE_BYTES = 1024 * 1024 * 1024
+COMPRESS_THRESHOLD = 256
+# Access times are refreshed at most this often, so hot reads stay read-only.
+ACCESS_RESOLUTION = 60.0
+EVICTION_BATCH = 64
+_ENTRY_OVERHEAD = 100
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    " fingerprint TEXT NOT NULL, kind TEXT NOT NULL, coordinates TEXT NOT NULL,"
+    " value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL,"
+    " PRIMARY KEY (fingerprint, kind, coordinates))",
+    "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)",
+    "CREATE TABLE IF NOT EXISTS usage (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO usage (id, size) VALUES (0, 0)",
+)
+
+
+def encode_value(value) -> bytes:
+    if isinstance(value, int):
+        return b'i' + str(value).encode()
+    data = value.encode('utf-8')
+    if len(data) >= COMPRESS_THRESHOLD:
+        packed = zlib.compress(data, 6)
+        if len(packed) < len(data):
+            return b'z' + packed
+    return b's' + data
+
+
+def decode_value(blob: bytes):
+    tag, data = blob[:1], blob[1:]
+    if tag == b'i':
+        return int(data)
+    if tag == b'z':
+        data = zlib.decompress(data)
+    return data.decode('utf-8')
+
+
+def _split_key(key) -> tuple:
+    fingerprint, kind, coordinates = key
+    return fingerprint, kind, ','.join(map(coordinate_text, coordinates))
+
+
+class DiskCache:
+    """SQLite-backed cache with the ``ContentCache`` interface, safe across threads and processes."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_DISK_CACHE_BYTES, timeout: float = 30.0):
+        if max_bytes < 1:
+            raise ValueError("Cache size must be positive")
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+        connection = self._connection()
+        with _Transaction(connection):
+            for statement in _SCHEMA:
+                connection.execute(statement)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened after a fork.
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None and self._local.pid == os.getpid():
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout,
+                                     isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        self._local.connection = connection
+        self._local.pid = os.getpid()
+        with self._lock:
+            self._connections.append(connection)
+        return connection
+
+    def get(self, key):
+        value = self.peek(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return value
+
+    def peek(self, key):
+        """Like get() without counting a hit or miss, for opportunistic probes."""
+        connection = self._connection()
+        parts = _split_key(key)
+        row = connection.execute(
+            "SELECT value, accessed FROM entries WHERE fingerprint = ? AND kind = ? AND coordinates = ?",
+            parts).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[1] > ACCESS_RESOLUTION:
+            connection.execute(
+                "UPDATE entries SET accessed = ? WHERE fingerprint = ? AND kind = ? AND coordinates = ?",
+                (now,) + parts)
+        return decode_value(row[0])
+
+    def put(self, key, value):
+        blob = encode_value(value)
+        parts = _split_key(key)
+        size = len(blob) + sum(len(part) for part in parts) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        connection = self._connection()
+        evicted = 0
+        with _Transaction(connection):
+            row = connection.execute(
+                "SELECT size FROM entries WHERE fingerprint = ? AND kind = ? AND coordinates = ?",
+                parts).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO entries (fingerprint, kind, coordinates, value, size, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)", parts + (blob, size, time.time()))
+            connection.execute("UPDATE usage SET size = size + ? WHERE id = 0",
+                               (size - (row[0] if row else 0),))
+            total = connection.execute("SELECT size FROM usage WHERE id = 0").fetchone()[0]
+            while total > self.max_bytes:
+                victims = connection.execute(
+                    "SELECT fingerprint, kind, coordinates, size FROM entries ORDER BY accessed LIMIT ?",
+                    (EVICTION_BATCH,)).fetchall()
+                for fingerprint, kind, coordinates, victim_size in victims:
+                    if total <= self.max_bytes:
+                        break
+                    connection.execute(
+                        "DELETE FROM entries WHERE fingerprint = ? AND kind = ? AND coordinates = ?",
+                        (fingerprint, kind, coordinates))
+                    total -= victim_size
+                    evicted += 1
+            connection.execute("UPDATE usage SET size = ? WHERE id = 0", (total,))
+        if evicted:
+            with self._lock:
+                self._evictions += evicted
+
+    def stats(self) -> CacheStats:
+        connection = self._connection()
+        entries = connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        size = connection.execute("SELECT size FROM usage WHERE id = 0").fetchone()[0]
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, entries, size, self.max_bytes)
+
+    def clear(self):
+        connection = self._connection()
+        with _Transaction(connection):
+            connection.execute("DELETE FROM entries")
+            connection.execute("UPDATE usage SET size = 0 WHERE id = 0")
+
+    def close(self):
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def __getstate__(self):
+        return {'path': self.path, 'max_bytes': self.max_bytes, 'timeout': self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['max_bytes'], state['timeout'])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _Transaction:
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    def __enter__(self):
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._connection.execute("ROLLBACK" if exc_type else "COMMIT")
@@ -0,0 +1,23 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.bijective_engine import BijectiveGenerator
+from smart_babylon_library.library.generator import DeterministicGenerator, AcceleratedGenerator
+from smart_babylon_library.library.seekable_engine import SeekableGenerator
+
+
+def create_generator(config: LibraryConfig) -> DeterministicGenerator:
+    if config.engine == 'numpy-v1':
+        # Imported lazily so numpy stays an optional dependency.
+        from smart_babylon_library.library.numpy_engine import NumpyGenerator
+        return NumpyGenerator(config)
+    if config.engine == 'seekable-v1':
+        return SeekableGenerator(config)
+    if config.engine == 'bijective-v1':
+        return BijectiveGenerator(config)
+    return AcceleratedGenerator(config)
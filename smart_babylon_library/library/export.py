@@ -0,0 +1,95 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import time
+from dataclasses import dataclass
+
+from smart_babylon_library.library.book import LibraryBook
+from smart_babylon_library.library.parallel import generate_page, parallel_map
+from smart_babylon_library.library.serialization import page_record
+
+EXPORT_FORMATS = ('jsonl', 'text', 'book')
+
+
+@dataclass
+class ExportProgress:
+    pages_done: int
+    pages_total: int
+    chars: int
+    elapsed: float
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages_done / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (f"{self.pages_done}/{self.pages_total} pages, {self.chars} chars, "
+                f"{self.pages_per_second:.1f} pages/s, {self.chars_per_second:.0f} chars/s")
+
+
+class BookExporter:
+    """
+    Writes a whole book to a text stream page by page.
+
+    Pages are generated by parallel workers and reassembled in page order;
+    at most ``window`` page batches are in flight, so memory stays bounded
+    for books of any size.
+    """
+
+    def __init__(self, library, workers: int = None, window: int = None, batch_size: int = 4,
+                 progress=None, progress_interval: float = 1.0):
+        self.library = library
+        self.workers = workers
+        self.window = window
+        self.batch_size = batch_size
+        self.progress = progress
+        self.progress_interval = progress_interval
+
+    def export(self, book: LibraryBook, fp, fmt: str = 'jsonl', start_page: int = 0,
+               end_page: int = None) -> ExportProgress:
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{fmt}', expected one of {', '.join(EXPORT_FORMATS)}")
+        end_page = book.max_pages if end_page is None else min(end_page, book.max_pages)
+        if start_page < 0 or start_page > end_page:
+            raise ValueError("Invalid page range")
+
+        base = book.coordinates
+        page_values = ((base.floor, base.room, base.cabinet, base.shelf, base.book, page_number)
+                       for page_number in range(start_page, end_page))
+        results = parallel_map(self.library.config, generate_page, page_values, workers=self.workers,
+                               batch_size=self.batch_size, window=self.window, generator=self.library.generator)
+
+        if fmt == 'book':
+            fp.write(f"{book.title}\n\n")
+        started = last_report = time.perf_counter()
+        pages_done = chars = 0
+        for values, content in results:
+            self._write_page(fp, fmt, book, values, content)
+            pages_done += 1
+            chars += len(content)
+            now = time.perf_counter()
+            if self.progress is not None and now - last_report >= self.progress_interval:
+                self.progress(ExportProgress(pages_done, end_page - start_page, chars, now - started))
+                last_report = now
+
+        result = ExportProgress(pages_done, end_page - start_page, chars, time.perf_counter() - started)
+        if self.progress is not None:
+            self.progress(result)
+        return result
+
+    def _write_page(self, fp, fmt: str, book: LibraryBook, values, content: str):
+        if fmt == 'jsonl':
+            fp.write(page_record(self.library.config.universe, values, content, 'jsonl'))
+        elif fmt == 'text':
+            fp.write(content)
+            fp.write('\n')
+        else:
+            fp.write(f"[Page {values[5]}]\n{content}\n\n")
@@ -5,44 +5,299 @@
 # --------------------------------------------------------
 # https://github.com/smartlegionlab
 # --------------------------------------------------------
+import array
+import codecs
+import copy
 import hashlib
 import random
+import sys
 from typing import List
 
 from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.coordinates import seed_text
+from smart_babylon_library.library.seeding import SeedDeriver
+
+DEFAULT_CHUNK_SIZE = 8192
+VERIFY_CHUNK_SIZE = 4096
+
+
+def coordinate_values(coordinates) -> tuple:
+    """Coordinates as a 6-tuple; generators accept LibraryCoordinates or plain tuples."""
+    if isinstance(coordinates, tuple):
+        return coordinates
+    return (coordinates.floor, coordinates.room, coordinates.cabinet,
+            coordinates.shelf, coordinates.book, coordinates.page)
+
+
+def coordinate_seed(coordinates) -> str:
+    if isinstance(coordinates, tuple):
+        return seed_text(coordinates)
+    return coordinates.seed
+
+
+def build_character_list(character_sets) -> List[str]:
+    all_chars = []
+    for char_set in character_sets:
+        all_chars.extend(char_set.characters)
+    return sorted(all_chars)
 
 
 class DeterministicGenerator:
     def __init__(self, config: LibraryConfig):
         self.config = config
-        self._all_chars = self._build_character_list()
+        self.fingerprint = None
+        self._all_chars = tuple(self._build_character_list())
+        self._char_index = {}
+        for index, char in enumerate(self._all_chars):
+            self._char_index.setdefault(char, index)
+        self._single_chars = all(len(char) == 1 for char in self._all_chars)
+        self._bind_universe()
+
+    def _bind_universe(self):
+        # Everything derived from the universe name; the rest is shared by for_universe().
+        self._universe_prefix = f"{self.config.universe}:".encode()
+
+    def for_universe(self, universe: str) -> 'DeterministicGenerator':
+        """Copy of this generator for another universe, sharing the compiled alphabet tables."""
+        if not isinstance(universe, str):
+            raise ValueError("Universe must be a string")
+        generator = copy.copy(self)
+        generator.config = copy.copy(self.config)
+        generator.config.universe = universe
+        generator.fingerprint = None
+        generator._bind_universe()
+        return generator
 
     def _build_character_list(self) -> List[str]:
-        all_chars = []
-        for char_set in self.config.character_sets:
-            all_chars.extend(char_set.characters)
-        return sorted(all_chars)
+        return build_character_list(self.config.character_sets)
+
+    def _derive_seed(self, seed: str) -> int:
+        seed_hash = hashlib.sha256(self._universe_prefix + seed.encode()).digest()
+        return int.from_bytes(seed_hash, 'big')
 
     def _get_deterministic_random(self, seed: str) -> random.Random:
-        full_seed = f"{self.config.universe}:{seed}"
-        seed_hash = hashlib.sha256(full_seed.encode()).hexdigest()
-        return random.Random(int(seed_hash, 16))
+        return random.Random(self._derive_seed(seed))
 
     def generate_book_title(self, coordinates) -> str:
-        random_generator = self._get_deterministic_random(f"title_{coordinates.seed}")
+        random_generator = self._get_deterministic_random(f"title_{coordinate_seed(coordinates)}")
         min_len, max_len = self.config.title_length_range
         title_length = random_generator.randint(min_len, max_len)
         title_chars = [random_generator.choice(self._all_chars) for _ in range(title_length)]
         return ''.join(title_chars)
 
     def generate_page_content(self, coordinates) -> str:
-        random_generator = self._get_deterministic_random(f"content_{coordinates.seed}")
+        random_generator = self._get_deterministic_random(f"content_{coordinate_seed(coordinates)}")
         min_len, max_len = self.config.content_length_range
         content_length = random_generator.randint(min_len, max_len)
         content_chars = [random_generator.choice(self._all_chars) for _ in range(content_length)]
         return ''.join(content_chars)
 
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        random_generator = self._get_deterministic_random(f"content_{coordinate_seed(coordinates)}")
+        min_len, max_len = self.config.content_length_range
+        remaining = random_generator.randint(min_len, max_len)
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            yield ''.join([random_generator.choice(self._all_chars) for _ in range(count)])
+            remaining -= count
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Yield the page as chunks of indices into the character list, never building text."""
+        random_generator = self._get_deterministic_random(f"content_{coordinate_seed(coordinates)}")
+        min_len, max_len = self.config.content_length_range
+        remaining = random_generator.randint(min_len, max_len)
+        size = len(self._all_chars)
+        if not size:
+            raise IndexError('Cannot choose from an empty sequence')
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            # random.choice(seq) is seq[_randbelow(len(seq))].
+            yield [random_generator._randbelow(size) for _ in range(count)]
+            remaining -= count
+
+    def get_page_length(self, coordinates) -> int:
+        """Page length in characters; drawn without generating the page when every symbol is one character."""
+        if not self._single_chars:
+            return len(self.generate_page_content(coordinates))
+        return self._page_symbol_count(coordinates)
+
+    def _page_symbol_count(self, coordinates) -> int:
+        # The length is the first value drawn for a page, so no characters are needed.
+        random_generator = self._get_deterministic_random(f"content_{coordinate_seed(coordinates)}")
+        min_len, max_len = self.config.content_length_range
+        return random_generator.randint(min_len, max_len)
+
+    def read_page_content(self, coordinates, offset: int, length: int) -> str:
+        return self.generate_page_content(coordinates)[offset:offset + length]
+
+    def verify_page_content(self, coordinates, text: str, offset: int = 0) -> bool:
+        """
+        True when the page holds ``text`` at ``offset``. The page length is checked
+        before any character is drawn, and generation stops at the first mismatching chunk.
+        """
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        end = offset + len(text)
+        if self._single_chars and end > self.get_page_length(coordinates):
+            return False
+        position = 0
+        for chunk in self.iter_page_content(coordinates, VERIFY_CHUNK_SIZE):
+            chunk_end = position + len(chunk)
+            if chunk_end > offset:
+                start, stop = max(offset, position), min(end, chunk_end)
+                if chunk[start - position:stop - position] != text[start - offset:stop - offset]:
+                    return False
+                if stop == end:
+                    return True
+            position = chunk_end
+        return end <= position
+
+    def iter_page_lengths(self, coordinates):
+        """Yield the page length for each item of an iterable of page coordinates."""
+        for item in coordinates:
+            yield self.get_page_length(item)
+
+    def get_max_pages_for_book(self, coordinates) -> int:
+        random_generator = self._get_deterministic_random(f"pages_{coordinate_seed(coordinates)}")
+        min_pages, max_pages = self.config.pages_per_book_range
+        return random_generator.randint(min_pages, max_pages)
+
+    def iter_book_metadata(self, coordinates):
+        """Yield (coordinates, title, page_count) for an iterable of book coordinates."""
+        for item in coordinates:
+            yield item, self.generate_book_title(item), self.get_max_pages_for_book(item)
+
+
+class AcceleratedGenerator(DeterministicGenerator):
+    """
+    Bit-exact accelerated implementation of DeterministicGenerator.
+
+    random.Random.choice draws one 32-bit Mersenne Twister word per attempt,
+    keeps its top k = n.bit_length() bits and rejects values >= n. Here the
+    words are pulled in bulk with a single getrandbits call and the same
+    rejection sampling is replayed over the whole batch, so titles and pages
+    are identical to the reference implementation.
+    """
+
+    _BATCH_SLACK = 64
+
+    def __init__(self, config: LibraryConfig):
+        super().__init__(config)
+        size = len(self._all_chars)
+        self._alphabet_size = size
+        self._index_bits = size.bit_length()
+        self._index_shift = 32 - self._index_bits
+
+        self._byte_table = None
+        self._byte_rejects = None
+        if size and self._index_bits <= 8:
+            byte_shift = 8 - self._index_bits
+            self._byte_table = bytes(value >> byte_shift if (value >> byte_shift) < size else 0
+                                     for value in range(256))
+            self._byte_rejects = bytes(value for value in range(256) if (value >> byte_shift) >= size)
+
+        self._charmap = None
+        if self._byte_table is not None and all(len(char) == 1 for char in self._all_chars):
+            self._charmap = ''.join(self._all_chars) + '￾' * (256 - size)
+
+    def _bind_universe(self):
+        super()._bind_universe()
+        self._seeds = SeedDeriver(self._universe_prefix)
+
+    def _derive_coordinate_seed(self, kind: str, coordinates) -> int:
+        # Same value as _derive_seed(f"{kind}_{coordinate_seed(coordinates)}").
+        return self._seeds.derive(kind, coordinate_values(coordinates))
+
+    def _get_coordinate_random(self, kind: str, coordinates) -> random.Random:
+        return random.Random(self._derive_coordinate_seed(kind, coordinates))
+
+    def _draw_indices(self, random_generator: random.Random, count: int):
+        words = count * (1 << self._index_bits) // self._alphabet_size + self._BATCH_SLACK
+        data = random_generator.getrandbits(32 * words).to_bytes(4 * words, 'little')
+        if self._byte_table is not None:
+            # Only the most significant byte of each little-endian word matters.
+            return data[3::4].translate(self._byte_table, self._byte_rejects)
+        values = array.array('I')
+        values.frombytes(data)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        shift, size = self._index_shift, self._alphabet_size
+        return [value >> shift for value in values if value >> shift < size]
+
+    def _decode_indices(self, indices) -> str:
+        if self._charmap is not None:
+            return codecs.charmap_decode(indices, 'strict', self._charmap)[0]
+        return ''.join([self._all_chars[index] for index in indices])
+
+    def _iter_indices(self, random_generator: random.Random, length: int, chunk_size: int):
+        if not self._alphabet_size:
+            raise IndexError('Cannot choose from an empty sequence')
+        # Accepted indices beyond the current chunk are carried over, so the
+        # chunked stream stays identical to drawing the text in one go.
+        pending = b'' if self._byte_table is not None else []
+        remaining = length
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            while len(pending) < count:
+                pending += self._draw_indices(random_generator, count - len(pending))
+            yield pending[:count]
+            pending = pending[count:]
+            remaining -= count
+
+    def _iter_text(self, random_generator: random.Random, length: int, chunk_size: int):
+        return map(self._decode_indices, self._iter_indices(random_generator, length, chunk_size))
+
+    def _draw_text(self, random_generator: random.Random, length: int) -> str:
+        return ''.join(self._iter_text(random_generator, length, max(length, 1)))
+
+    def generate_book_title(self, coordinates) -> str:
+        random_generator = self._get_coordinate_random('title', coordinates)
+        min_len, max_len = self.config.title_length_range
+        return self._draw_text(random_generator, random_generator.randint(min_len, max_len))
+
+    def generate_page_content(self, coordinates) -> str:
+        random_generator = self._get_coordinate_random('content', coordinates)
+        min_len, max_len = self.config.content_length_range
+        return self._draw_text(random_generator, random_generator.randint(min_len, max_len))
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        random_generator = self._get_coordinate_random('content', coordinates)
+        min_len, max_len = self.config.content_length_range
+        return self._iter_text(random_generator, random_generator.randint(min_len, max_len), chunk_size)
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        random_generator = self._get_coordinate_random('content', coordinates)
+        min_len, max_len = self.config.content_length_range
+        return self._iter_indices(random_generator, random_generator.randint(min_len, max_len), chunk_size)
+
+    def _page_symbol_count(self, coordinates) -> int:
+        random_generator = self._get_coordinate_random('content', coordinates)
+        min_len, max_len = self.config.content_length_range
+        return random_generator.randint(min_len, max_len)
+
     def get_max_pages_for_book(self, coordinates) -> int:
-        random_generator = self._get_deterministic_random(f"pages_{coordinates.seed}")
+        random_generator = self._get_coordinate_random('pages', coordinates)
         min_pages, max_pages = self.config.pages_per_book_range
         return random_generator.randint(min_pages, max_pages)
+
+    def iter_page_lengths(self, coordinates):
+        if not self._single_chars:
+            yield from super().iter_page_lengths(coordinates)
+            return
+        random_generator = random.Random()
+        min_len, max_len = self.config.content_length_range
+        for item in coordinates:
+            random_generator.seed(self._derive_coordinate_seed('content', item))
+            yield random_generator.randint(min_len, max_len)
+
+    def iter_book_metadata(self, coordinates):
+        # One Random instance is re-seeded for every item instead of building
+        # two per book; seeding an instance is exactly what Random(x) does.
+        random_generator = random.Random()
+        min_pages, max_pages = self.config.pages_per_book_range
+        min_len, max_len = self.config.title_length_range
+        for item in coordinates:
+            random_generator.seed(self._derive_coordinate_seed('title', item))
+            title = self._draw_text(random_generator, random_generator.randint(min_len, max_len))
+            random_generator.seed(self._derive_coordinate_seed('pages', item))
+            yield item, title, random_generator.randint(min_pages, max_pages)
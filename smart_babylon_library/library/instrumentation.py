@@ -0,0 +1,207 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Opt-in instrumentation of generation hot paths.
+
+Nothing here runs unless SmartBabylonLibrary.enable_instrumentation() is
+called: the library then wraps its generator in InstrumentedGenerator, and
+disabling restores the bare generator, so the disabled cost is zero.
+"""
+import copy
+import threading
+import time
+from typing import Callable, Dict
+
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE
+
+LENGTH_BUCKETS = (16, 256, 1024, 4096, 16384, 65536, float('inf'))
+LATENCY_BUCKETS = (0.00001, 0.0001, 0.001, 0.01, 0.1, 1.0, float('inf'))
+_SEED_METHODS = ('_derive_seed', '_derive_coordinate_seed', '_get_bit_generator', '_get_key')
+
+
+def _bucket_label(bound: float) -> str:
+    return '+Inf' if bound == float('inf') else f'{bound:g}'
+
+
+class _OperationStats:
+    __slots__ = ('count', 'seconds', 'chars', 'by_length')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.chars = 0
+        # length bucket index -> [count, seconds, latency bucket counts]
+        self.by_length = {}
+
+
+class Instrumentation:
+    def __init__(self):
+        self._operations: Dict[str, _OperationStats] = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, callback: Callable[[dict], None], sample_every: int = 1):
+        """Call ``callback(event)`` for every ``sample_every``-th recorded operation."""
+        if sample_every < 1:
+            raise ValueError("sample_every must be positive")
+        self._hooks.append([callback, sample_every, 0])
+
+    def remove_hook(self, callback: Callable[[dict], None]):
+        self._hooks = [hook for hook in self._hooks if hook[0] is not callback]
+
+    def record(self, operation: str, seconds: float, length: int = 0):
+        length_index = next(index for index, bound in enumerate(LENGTH_BUCKETS) if length <= bound)
+        latency_index = next(index for index, bound in enumerate(LATENCY_BUCKETS) if seconds <= bound)
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = _OperationStats()
+            stats.count += 1
+            stats.seconds += seconds
+            stats.chars += length
+            bucket = stats.by_length.get(length_index)
+            if bucket is None:
+                bucket = stats.by_length[length_index] = [0, 0.0, [0] * len(LATENCY_BUCKETS)]
+            bucket[0] += 1
+            bucket[1] += seconds
+            bucket[2][latency_index] += 1
+            due = []
+            for hook in self._hooks:
+                hook[2] += 1
+                if hook[2] >= hook[1]:
+                    hook[2] = 0
+                    due.append(hook[0])
+        for callback in due:
+            callback({'operation': operation, 'seconds': seconds, 'length': length})
+
+    def reset(self):
+        with self._lock:
+            self._operations.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            operations = {}
+            for name, stats in self._operations.items():
+                by_length = {}
+                for length_index, (count, seconds, latency) in sorted(stats.by_length.items()):
+                    by_length[_bucket_label(LENGTH_BUCKETS[length_index])] = {
+                        'count': count,
+                        'seconds': seconds,
+                        'latency': {_bucket_label(bound): hits for bound, hits in zip(LATENCY_BUCKETS, latency)},
+                    }
+                operations[name] = {
+                    'count': stats.count,
+                    'seconds': stats.seconds,
+                    'chars': stats.chars,
+                    'by_length': by_length,
+                }
+        return {'operations': operations}
+
+    def to_dict(self) -> dict:
+        return self.snapshot()
+
+    def to_prometheus(self, prefix: str = 'smart_babylon') -> str:
+        operations = self.snapshot()['operations']
+        lines = [
+            f'# HELP {prefix}_operation_seconds Generation latency by operation and generated length.',
+            f'# TYPE {prefix}_operation_seconds histogram',
+        ]
+        for name, stats in operations.items():
+            for length_label, bucket in stats['by_length'].items():
+                labels = f'operation="{name}",length_le="{length_label}"'
+                cumulative = 0
+                for latency_label, hits in bucket['latency'].items():
+                    cumulative += hits
+                    lines.append(f'{prefix}_operation_seconds_bucket{{{labels},le="{latency_label}"}} {cumulative}')
+                lines.append(f'{prefix}_operation_seconds_sum{{{labels}}} {bucket["seconds"]!r}')
+                lines.append(f'{prefix}_operation_seconds_count{{{labels}}} {bucket["count"]}')
+        lines.append(f'# HELP {prefix}_generated_chars_total Characters produced by operation.')
+        lines.append(f'# TYPE {prefix}_generated_chars_total counter')
+        for name, stats in operations.items():
+            lines.append(f'{prefix}_generated_chars_total{{operation="{name}"}} {stats["chars"]}')
+        return '\n'.join(lines) + '\n'
+
+
+def _timed_seed(function, instrumentation: Instrumentation):
+    def timed(*args):
+        started = time.perf_counter()
+        result = function(*args)
+        instrumentation.record('seed', time.perf_counter() - started)
+        return result
+    return timed
+
+
+def instrument_seeding(generator, instrumentation: Instrumentation):
+    """Return a shallow copy of a compiled generator whose seed derivation is timed."""
+    instrumented = copy.copy(generator)
+    for name in _SEED_METHODS:
+        if hasattr(generator, name):
+            setattr(instrumented, name, _timed_seed(getattr(generator, name), instrumentation))
+    return instrumented
+
+
+class InstrumentedGenerator:
+    """Times the public generator operations; other attributes are delegated."""
+
+    def __init__(self, generator, instrumentation: Instrumentation):
+        self._generator = generator
+        self.instrumentation = instrumentation
+
+    def __getattr__(self, name):
+        return getattr(self._generator, name)
+
+    def _timed(self, operation: str, function, *args):
+        started = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - started
+        self.instrumentation.record(operation, elapsed, len(result) if isinstance(result, str) else 0)
+        return result
+
+    def generate_book_title(self, coordinates) -> str:
+        return self._timed('title', self._generator.generate_book_title, coordinates)
+
+    def get_max_pages_for_book(self, coordinates) -> int:
+        return self._timed('pages', self._generator.get_max_pages_for_book, coordinates)
+
+    def generate_page_content(self, coordinates) -> str:
+        return self._timed('page', self._generator.generate_page_content, coordinates)
+
+    def get_page_length(self, coordinates) -> int:
+        return self._timed('length', self._generator.get_page_length, coordinates)
+
+    def read_page_content(self, coordinates, offset: int, length: int) -> str:
+        return self._timed('read', self._generator.read_page_content, coordinates, offset, length)
+
+    def verify_page_content(self, coordinates, text: str, offset: int = 0) -> bool:
+        started = time.perf_counter()
+        result = self._generator.verify_page_content(coordinates, text, offset)
+        self.instrumentation.record('verify', time.perf_counter() - started, len(text))
+        return result
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        return self._timed_stream('stream', self._generator.iter_page_content(coordinates, chunk_size))
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        return self._timed_stream('indices', self._generator.iter_page_indices(coordinates, chunk_size))
+
+    def _timed_stream(self, operation: str, chunks):
+        seconds = 0.0
+        length = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                try:
+                    chunk = next(chunks)
+                except StopIteration:
+                    seconds += time.perf_counter() - started
+                    break
+                seconds += time.perf_counter() - started
+                length += len(chunk)
+                yield chunk
+        finally:
+            self.instrumentation.record(operation, seconds, length)
@@ -0,0 +1,120 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Vectorized page generation engine ("numpy-v1").
+
+Character indices for a whole page are drawn in one call from a Philox
+counter-based bit generator keyed with the SHA-256 seed of the item, so
+content differs from the legacy engine but is still fully deterministic.
+Only raw 64-bit Philox words are used (never numpy's distribution methods),
+which keeps the stream stable across numpy releases.
+"""
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE, DeterministicGenerator, coordinate_values
+from smart_babylon_library.library.seeding import SeedDeriver
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+class NumpyGenerator(DeterministicGenerator):
+    engine = 'numpy-v1'
+
+    def __init__(self, config: LibraryConfig):
+        if np is None:
+            raise ImportError(
+                "The 'numpy-v1' engine requires numpy: pip install smart-babylon-library[numpy]"
+            )
+        super().__init__(config)
+        self._alphabet_size = len(self._all_chars)
+        if all(len(char) == 1 for char in self._all_chars):
+            self._code_points = np.array([ord(char) for char in self._all_chars], dtype='<u4')
+            self._alphabet = None
+        else:
+            self._code_points = None
+            self._alphabet = np.array(self._all_chars, dtype=object)
+
+    def _bind_universe(self):
+        super()._bind_universe()
+        self._keys = SeedDeriver(f"{self.config.universe}:{self.engine}:".encode())
+
+    def _get_bit_generator(self, kind: str, coordinates):
+        digest = self._keys.digest(kind, coordinate_values(coordinates))
+        return np.random.Philox(key=int.from_bytes(digest[:16], 'little'))
+
+    @staticmethod
+    def _draw_length(bit_generator, length_range) -> int:
+        min_len, max_len = length_range
+        word = int(bit_generator.random_raw())
+        return min_len + ((word * (max_len - min_len + 1)) >> 64)
+
+    def _decode(self, indices) -> str:
+        if self._code_points is not None:
+            return self._code_points[indices].tobytes().decode('utf-32-le')
+        return ''.join(self._alphabet[indices])
+
+    def _iter_indices(self, bit_generator, length: int, chunk_size: int):
+        if not self._alphabet_size:
+            raise IndexError('Cannot choose from an empty sequence')
+        size = np.uint64(self._alphabet_size)
+        shift = np.uint64(32)
+        carried = None
+        remaining = length
+        while remaining > 0:
+            count = min(chunk_size, remaining)
+            # Each 64-bit word yields two 32-bit halves, scaled to an index by multiply-shift
+            # straight into one array per chunk; an odd half left over opens the next chunk.
+            start = 0 if carried is None else 1
+            halves = bit_generator.random_raw((count - start + 1) // 2).view('<u4')
+            indices = np.empty(start + len(halves), dtype=np.uint64)
+            if carried is not None:
+                indices[0] = carried
+            scaled = indices[start:]
+            np.multiply(halves, size, out=scaled, dtype=np.uint64)
+            np.right_shift(scaled, shift, out=scaled)
+            carried = indices[count] if len(indices) > count else None
+            # Indices are below 2 ** 32, so the signed view is exact.
+            yield indices[:count].view(np.int64)
+            remaining -= count
+
+    def _iter_text(self, bit_generator, length: int, chunk_size: int):
+        return map(self._decode, self._iter_indices(bit_generator, length, chunk_size))
+
+    def _draw_text(self, bit_generator, length: int) -> str:
+        return ''.join(self._iter_text(bit_generator, length, max(length, 1)))
+
+    def generate_book_title(self, coordinates) -> str:
+        bit_generator = self._get_bit_generator('title', coordinates)
+        title_length = self._draw_length(bit_generator, self.config.title_length_range)
+        return self._draw_text(bit_generator, title_length)
+
+    def generate_page_content(self, coordinates) -> str:
+        bit_generator = self._get_bit_generator('content', coordinates)
+        content_length = self._draw_length(bit_generator, self.config.content_length_range)
+        return self._draw_text(bit_generator, content_length)
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        bit_generator = self._get_bit_generator('content', coordinates)
+        content_length = self._draw_length(bit_generator, self.config.content_length_range)
+        return self._iter_text(bit_generator, content_length, chunk_size)
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        bit_generator = self._get_bit_generator('content', coordinates)
+        content_length = self._draw_length(bit_generator, self.config.content_length_range)
+        return self._iter_indices(bit_generator, content_length, chunk_size)
+
+    def _page_symbol_count(self, coordinates) -> int:
+        bit_generator = self._get_bit_generator('content', coordinates)
+        return self._draw_length(bit_generator, self.config.content_length_range)
+
+    def get_max_pages_for_book(self, coordinates) -> int:
+        bit_generator = self._get_bit_generator('pages', coordinates)
+        return self._draw_length(bit_generator, self.config.pages_per_book_range)
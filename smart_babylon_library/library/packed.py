@@ -0,0 +1,290 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Packed binary pages: character indices stored at ceil(log2(alphabet size)) bits each.
+
+A page document is ``PAGE_MAGIC``, a header and one record; a container is
+``CONTAINER_MAGIC``, the same header and any number of records. The header is
+the format version, the bits per character, the first 16 bytes of the config
+fingerprint and an 8 byte alphabet hash. A record is the six coordinates and
+the page length in symbols as unsigned LEB128 varints followed by the packed
+indices. Generated pages can be packed from their index stream; other text over
+an alphabet with symbols of several code points is split longest match first,
+backing off wherever that would leave a remainder no symbols can spell.
+"""
+import codecs
+import functools
+import hashlib
+import re
+import struct
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.generator import coordinate_values
+from smart_babylon_library.library.registry import DEFAULT_REGISTRY_SIZE, config_alphabet, config_fingerprint
+
+PAGE_MAGIC = b'SBLP'
+CONTAINER_MAGIC = b'SBLC'
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct('>4sBB16s8s')
+
+
+def encode_varint(value: int) -> bytes:
+    if value < 0:
+        raise ValueError("Varint value must be non-negative")
+    out = bytearray()
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def read_varint(read) -> int:
+    """Read a varint through ``read(1)``; returns None at a clean end of input."""
+    value = shift = 0
+    while True:
+        byte = read(1)
+        if not byte:
+            if shift:
+                raise ValueError("Truncated varint")
+            return None
+        value |= (byte[0] & 0x7f) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+class PageCodec:
+    """Bit packing of page text over the distinct symbols of one configuration."""
+
+    def __init__(self, fingerprint: str, alphabet):
+        alphabet = tuple(alphabet)
+        self.symbols = tuple(dict.fromkeys(alphabet))
+        self.bits = max(1, (len(self.symbols) - 1).bit_length())
+        self.fingerprint = bytes.fromhex(fingerprint)[:16]
+        self.alphabet_hash = hashlib.sha256(''.join(self.symbols).encode()).digest()[:8]
+        codes = [format(index, f'0{self.bits}b') for index in range(len(self.symbols))]
+        self._symbol_set = frozenset(self.symbols)
+        self._single_code_points = all(len(symbol) == 1 for symbol in self.symbols)
+        self._decode_table = dict(zip(codes, self.symbols))
+        symbol_codes = dict(zip(self.symbols, codes))
+        # Code of every entry of the character list, which generator index streams point into.
+        self._index_codes = [symbol_codes[symbol] for symbol in alphabet]
+        self._code_pattern = re.compile(f'[01]{{{self.bits}}}')
+        if self._single_code_points:
+            self._encode_table = {ord(char): code for char, code in zip(self.symbols, codes)}
+            # With 8 bit codes each index is one byte, so both directions map whole strings.
+            self._byte_table = {ord(char): index for index, char in enumerate(self.symbols)}
+            self._byte_map = ''.join(self.symbols) + '\ufffe' * (256 - len(self.symbols))
+        else:
+            self._symbol_codes = symbol_codes
+            self._max_symbol_length = max(len(symbol) for symbol in self.symbols)
+
+    @property
+    def single_code_points(self) -> bool:
+        """True when every symbol is one code point, so text maps to indices character by character."""
+        return self._single_code_points
+
+    def packed_size(self, length: int) -> int:
+        return (length * self.bits + 7) // 8
+
+    def _tokenize(self, text: str) -> list:
+        # steps[position] is (size, code) of the longest symbol at position after which
+        # the rest of the text still splits into symbols, so overlapping symbols such
+        # as 'a', 'ab' and 'bc' never strand a text that has some valid split.
+        end = len(text)
+        steps = [None] * end + [(0, None)]
+        for position in range(end - 1, -1, -1):
+            for size in range(min(self._max_symbol_length, end - position), 0, -1):
+                code = self._symbol_codes.get(text[position:position + size])
+                if code is not None and steps[position + size] is not None:
+                    steps[position] = size, code
+                    break
+        if steps[0] is None:
+            raise ValueError("Text contains characters outside the alphabet")
+        codes, position = [], 0
+        while position < end:
+            size, code = steps[position]
+            codes.append(code)
+            position += size
+        return codes
+
+    def pack(self, text: str) -> bytes:
+        return self._pack(text)[1]
+
+    def _pack(self, text: str):
+        """Return ``(length in symbols, payload)``."""
+        if not self._single_code_points:
+            return self._pack_codes(self._tokenize(text))
+        if not self._symbol_set.issuperset(text):
+            raise ValueError("Text contains characters outside the alphabet")
+        if not text:
+            return 0, b''
+        if self.bits == 8:
+            return len(text), text.translate(self._byte_table).encode('latin-1')
+        # Translating to binary digits and parsing them as one integer keeps the
+        # per-character work inside str.translate and int().
+        return len(text), self._pack_bits(len(text), text.translate(self._encode_table))
+
+    def _pack_indices(self, indices):
+        """Pack chunks of indices into the character list, as yielded by ``iter_page_indices``."""
+        index_codes = self._index_codes
+        return self._pack_codes([index_codes[index] for chunk in indices for index in chunk])
+
+    def _pack_codes(self, codes: list):
+        if not codes:
+            return 0, b''
+        return len(codes), self._pack_bits(len(codes), ''.join(codes))
+
+    def _pack_bits(self, length: int, bits: str) -> bytes:
+        size = self.packed_size(length)
+        return (int(bits, 2) << (size * 8 - len(bits))).to_bytes(size, 'big')
+
+    def unpack(self, payload: bytes, length: int) -> str:
+        """Decode ``length`` symbols from ``payload``."""
+        if len(payload) != self.packed_size(length):
+            raise ValueError("Packed payload does not match the page length")
+        if not length:
+            return ''
+        if self.bits == 8 and self._single_code_points:
+            try:
+                return codecs.charmap_decode(payload, 'strict', self._byte_map)[0]
+            except UnicodeDecodeError:
+                raise ValueError("Packed page holds an index outside the alphabet") from None
+        bits = format(int.from_bytes(payload, 'big'), f'0{len(payload) * 8}b')[:length * self.bits]
+        try:
+            return ''.join(map(self._decode_table.__getitem__, self._code_pattern.findall(bits)))
+        except KeyError:
+            raise ValueError("Packed page holds an index outside the alphabet") from None
+
+    def header(self, magic: bytes) -> bytes:
+        return _HEADER.pack(magic, FORMAT_VERSION, self.bits, self.fingerprint, self.alphabet_hash)
+
+    def check_header(self, data: bytes, magic: bytes):
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated packed header")
+        found_magic, version, bits, fingerprint, alphabet_hash = _HEADER.unpack_from(data)
+        if found_magic != magic:
+            raise ValueError("Not a packed page document" if magic == PAGE_MAGIC else "Not a packed page container")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported packed format version {version}")
+        if alphabet_hash != self.alphabet_hash or bits != self.bits:
+            raise ValueError("Packed data was written with a different alphabet")
+        if fingerprint != self.fingerprint:
+            raise ValueError("Packed data belongs to a different library configuration")
+
+    def encode_record(self, values, text: str) -> bytes:
+        return self._record(values, *self._pack(text))
+
+    def encode_indexed_record(self, values, indices) -> bytes:
+        """Like encode_record for a page given as its index stream rather than its text."""
+        return self._record(values, *self._pack_indices(indices))
+
+    @staticmethod
+    def _record(values, length: int, payload: bytes) -> bytes:
+        head = b''.join(encode_varint(value) for value in values)
+        return head + encode_varint(length) + payload
+
+    def read_record(self, read):
+        """Read one record through ``read(n)``; returns ``(values, text)`` or None at the end."""
+        first = read_varint(read)
+        if first is None:
+            return None
+        values = [first]
+        for _ in range(5):
+            value = read_varint(read)
+            if value is None:
+                raise ValueError("Truncated packed record")
+            values.append(value)
+        length = read_varint(read)
+        if length is None:
+            raise ValueError("Truncated packed record")
+        size = self.packed_size(length)
+        payload = read(size)
+        if len(payload) != size:
+            raise ValueError("Truncated packed record")
+        return tuple(values), self.unpack(payload, length)
+
+
+@functools.lru_cache(maxsize=DEFAULT_REGISTRY_SIZE)
+def _compile_codec(fingerprint: str, alphabet: tuple) -> PageCodec:
+    return PageCodec(fingerprint, alphabet)
+
+
+def get_codec(config: LibraryConfig) -> PageCodec:
+    return _compile_codec(config_fingerprint(config), config_alphabet(config))
+
+
+def encode_page(config: LibraryConfig, values, text: str) -> bytes:
+    codec = get_codec(config)
+    return codec.header(PAGE_MAGIC) + codec.encode_record(values, text)
+
+
+def encode_page_indices(config: LibraryConfig, values, indices) -> bytes:
+    """Like encode_page for a page given as chunks of indices into the character list."""
+    codec = get_codec(config)
+    return codec.header(PAGE_MAGIC) + codec.encode_indexed_record(values, indices)
+
+
+def decode_page(config: LibraryConfig, data: bytes):
+    """Decode a packed page document into ``(values, text)``."""
+    codec = get_codec(config)
+    codec.check_header(data, PAGE_MAGIC)
+    view = memoryview(data)[_HEADER.size:]
+    position = 0
+
+    def read(size):
+        nonlocal position
+        chunk = view[position:position + size]
+        position += len(chunk)
+        return chunk
+
+    record = codec.read_record(read)
+    if record is None or position != len(view):
+        raise ValueError("Malformed packed page document")
+    return record
+
+
+class PackedPageWriter:
+    """Writes a packed page container to a binary stream."""
+
+    def __init__(self, fp, config: LibraryConfig = None):
+        self.fp = fp
+        self.config = config or LibraryConfig()
+        self._codec = get_codec(self.config)
+        self.pages = 0
+        fp.write(self._codec.header(CONTAINER_MAGIC))
+
+    def write(self, values, text: str):
+        self.fp.write(self._codec.encode_record(values, text))
+        self.pages += 1
+
+    def write_indices(self, values, indices):
+        self.fp.write(self._codec.encode_indexed_record(values, indices))
+        self.pages += 1
+
+    def write_page(self, page):
+        self.write(coordinate_values(page.coordinates), page.content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.fp.flush()
+
+
+def iter_packed_records(fp, config: LibraryConfig = None):
+    """Yield ``(values, text)`` for each record of a packed page container."""
+    codec = get_codec(config or LibraryConfig())
+    codec.check_header(fp.read(_HEADER.size), CONTAINER_MAGIC)
+    while True:
+        record = codec.read_record(fp.read)
+        if record is None:
+            return
+        yield record
@@ -0,0 +1,197 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import multiprocessing
+import queue
+from collections import deque
+from typing import Iterable, Iterator, List, Tuple
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.coordinate_array import CoordinateArray
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.instrumentation import (
+    InstrumentedGenerator, Instrumentation, instrument_seeding
+)
+from smart_babylon_library.library.registry import get_generator, get_universe_generator
+
+DEFAULT_BATCH_SIZE = 16
+
+_worker_generator = None
+_worker_events = []
+
+
+def coordinate_tuples(coordinates: Iterable, book: bool = False) -> Iterator[Tuple[int, ...]]:
+    """Normalize a CoordinateArray, LibraryCoordinates, dicts or plain tuples to 6-tuples."""
+    if isinstance(coordinates, CoordinateArray):
+        # Already validated column-wise.
+        yield from coordinates.iter_tuples()
+        return
+    for item in coordinates:
+        if isinstance(item, dict):
+            item = LibraryCoordinates.from_dict(dict(item, page=item.get('page', 0)) if book else item)
+        if isinstance(item, LibraryCoordinates):
+            yield item.floor, item.room, item.cabinet, item.shelf, item.book, item.page
+            continue
+        values = tuple(item)
+        if book and len(values) == 5:
+            values += (0,)
+        if len(values) != 6:
+            raise ValueError("Coordinates must have six components")
+        if any(value < 0 for value in values):
+            raise ValueError("All coordinates must be non-negative")
+        yield values
+
+
+def generate_page(generator, values: Tuple[int, ...]) -> str:
+    return generator.generate_page_content(values)
+
+
+def generate_page_indices(generator, values: Tuple[int, ...]) -> list:
+    return [list(chunk) for chunk in generator.iter_page_indices(values)]
+
+
+def generate_book_metadata(generator, values: Tuple[int, ...]) -> Tuple[str, int]:
+    return generator.generate_book_title(values), generator.get_max_pages_for_book(values)
+
+
+def verify_page(generator, item: Tuple[Tuple[int, ...], str, int]) -> bool:
+    values, text, offset = item
+    return generator.verify_page_content(values, text, offset)
+
+
+def generate_page_in_universe(generator, item: Tuple[str, Tuple[int, ...]]) -> str:
+    universe, values = item
+    return get_universe_generator(generator.config, universe).generate_page_content(values)
+
+
+def generate_book_metadata_in_universe(generator, item: Tuple[str, Tuple[int, ...]]) -> Tuple[str, int]:
+    universe, values = item
+    return generate_book_metadata(get_universe_generator(generator.config, universe), values)
+
+
+def _init_worker(config: LibraryConfig, shard_paths: Tuple[str, ...] = (), instrumented: bool = False):
+    global _worker_generator
+    _worker_generator = get_generator(config)
+    if instrumented:
+        # Operations are recorded as events and replayed into the parent's instrumentation.
+        instrumentation = Instrumentation()
+        instrumentation.add_hook(_worker_events.append)
+        _worker_generator = instrument_seeding(_worker_generator, instrumentation)
+    if shard_paths:
+        # Imported here: shard.py materializes through parallel_map.
+        from smart_babylon_library.library.shard import Shard, ShardedGenerator
+        shards = tuple(Shard(path, config) for path in shard_paths)
+        _worker_generator = ShardedGenerator(_worker_generator, shards)
+    if instrumented:
+        _worker_generator = InstrumentedGenerator(_worker_generator, instrumentation)
+
+
+def _run_batch(task, batch: List[Tuple[int, ...]]) -> list:
+    return [task(_worker_generator, values) for values in batch]
+
+
+def _run_recorded_batch(task, batch: List[Tuple[int, ...]]) -> Tuple[list, list]:
+    results = _run_batch(task, batch)
+    events = _worker_events[:]
+    _worker_events.clear()
+    return results, events
+
+
+def _replay(instrumentation: Instrumentation, batch: list, output: Tuple[list, list]):
+    results, events = output
+    if instrumentation is not None:
+        for event in events:
+            instrumentation.record(event['operation'], event['seconds'], event['length'])
+    return zip(batch, results)
+
+
+def _batches(items: Iterable, batch_size: int) -> Iterator[list]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def parallel_map(config: LibraryConfig, task, items: Iterable, workers: int = None,
+                 ordered: bool = True, batch_size: int = DEFAULT_BATCH_SIZE,
+                 window: int = None, generator=None) -> Iterator[tuple]:
+    """
+    Yield (item, task(generator, item)) for every item.
+
+    In process the items go through ``generator`` (a library passes its own,
+    so its cache, shards and instrumentation apply), by default the compiled
+    generator for ``config``. With more than one worker the items are sent in
+    batches to a process pool whose workers compile the pickled config once
+    and mount the shards mounted on ``generator``; operations they run are
+    recorded in its instrumentation. At most ``window``
+    batches are in flight, so memory stays bounded however fast the input
+    is and however slowly results are consumed.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive")
+    if not workers or workers <= 1:
+        generator = generator or get_generator(config)
+        for item in items:
+            yield item, task(generator, item)
+        return
+
+    window = window or workers * 4
+    shard_paths = tuple(shard.path for shard in getattr(generator, 'shards', ()) if not shard.closed)
+    instrumentation = getattr(generator, 'instrumentation', None)
+    pool = multiprocessing.Pool(workers, initializer=_init_worker,
+                                initargs=(config, shard_paths, instrumentation is not None))
+    try:
+        if ordered:
+            yield from _ordered(pool, task, _batches(items, batch_size), window, instrumentation)
+        else:
+            yield from _unordered(pool, task, _batches(items, batch_size), window, instrumentation)
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _ordered(pool, task, batches: Iterator[list], window: int, instrumentation: Instrumentation = None):
+    in_flight = deque()
+    for batch in batches:
+        in_flight.append((batch, pool.apply_async(_run_recorded_batch, (task, batch))))
+        if len(in_flight) >= window:
+            batch, result = in_flight.popleft()
+            yield from _replay(instrumentation, batch, result.get())
+    while in_flight:
+        batch, result = in_flight.popleft()
+        yield from _replay(instrumentation, batch, result.get())
+
+
+def _unordered(pool, task, batches: Iterator[list], window: int, instrumentation: Instrumentation = None):
+    done = queue.Queue()
+    in_flight = 0
+
+    def submit(batch):
+        pool.apply_async(_run_recorded_batch, (task, batch),
+                         callback=lambda results: done.put((batch, results, None)),
+                         error_callback=lambda error: done.put((batch, None, error)))
+
+    def collect():
+        batch, results, error = done.get()
+        if error is not None:
+            raise error
+        return _replay(instrumentation, batch, results)
+
+    for batch in batches:
+        submit(batch)
+        in_flight += 1
+        if in_flight >= window:
+            yield from collect()
+            in_flight -= 1
+    while in_flight:
+        yield from collect()
+        in_flight -= 1
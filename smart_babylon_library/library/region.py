@@ -0,0 +1,59 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Coordinate regions: every coordinate axis accepts an int, a range or any
+iterable of ints, and regions are enumerated lazily in coordinate order.
+"""
+import itertools
+from typing import Iterator, Tuple
+
+from smart_babylon_library.library.coordinates import parse_coordinate
+
+AXES = ('floor', 'room', 'cabinet', 'shelf', 'book', 'page')
+
+
+def region_axis(value) -> tuple:
+    if isinstance(value, int):
+        values = (value,)
+    elif isinstance(value, range):
+        values = value
+    else:
+        values = tuple(value)
+    if len(values) and min(values) < 0:
+        raise ValueError("All coordinates must be non-negative")
+    return values
+
+
+def parse_axis(text: str):
+    """Parse '5', '0:10' or '1,4,7' into an axis value."""
+    if ':' in text:
+        start, stop = text.split(':', 1)
+        return range(int(start), int(stop))
+    if ',' in text:
+        return tuple(parse_coordinate(part) for part in text.split(','))
+    return parse_coordinate(text)
+
+
+def iter_book_coordinates(floor, room, cabinet, shelf, book) -> Iterator[Tuple[int, ...]]:
+    """Yield (floor, room, cabinet, shelf, book, 0) tuples for a region of books."""
+    axes = [region_axis(value) for value in (floor, room, cabinet, shelf, book)]
+    for values in itertools.product(*axes):
+        yield values + (0,)
+
+
+def iter_page_coordinates(generator, floor, room, cabinet, shelf, book, page=None) -> Iterator[Tuple[int, ...]]:
+    """Yield page 6-tuples; ``page=None`` means every page of each book."""
+    pages = None if page is None else region_axis(page)
+    for values in iter_book_coordinates(floor, room, cabinet, shelf, book):
+        book_pages = pages
+        if book_pages is None:
+            book_pages = range(generator.get_max_pages_for_book(values))
+        base = values[:5]
+        for page_number in book_pages:
+            yield base + (page_number,)
+
@@ -0,0 +1,157 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import dataclasses
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.engines import create_generator
+from smart_babylon_library.library.generator import DeterministicGenerator, build_character_list
+
+DEFAULT_REGISTRY_SIZE = 64
+
+
+def config_fingerprint(config: LibraryConfig) -> str:
+    """Stable content identity of a configuration, equal across processes."""
+    memo = _config_memo(config)
+    key = (config.engine, config.universe)
+    cached = config.__dict__.get('_fingerprint_cache')
+    if cached is None or cached[0] is not memo or cached[1] != key:
+        cached = (memo, key, _fingerprint(config.engine, config.universe, memo[1]))
+        config._fingerprint_cache = cached
+    return cached[2]
+
+
+def config_alphabet(config: LibraryConfig) -> tuple:
+    """The character list of ``config`` as a tuple, memoized like the fingerprint."""
+    return _config_memo(config)[2]
+
+
+def config_categories(config: LibraryConfig) -> tuple:
+    """``(name, characters)`` for each character set of ``config``, memoized like the fingerprint."""
+    return _config_memo(config)[3]
+
+
+def _config_memo(config: LibraryConfig) -> tuple:
+    # Building the tail sorts, encodes and hashes the whole alphabet, so it is
+    # kept on the config instance for as long as the fields it covers are
+    # unchanged. Character sets are compared by identity; the memo holds them,
+    # so their ids cannot be reused. Memos are replaced, never mutated, so
+    # copies of a config and concurrent readers never see a torn entry.
+    state = (tuple(config.title_length_range), tuple(config.content_length_range),
+             tuple(config.pages_per_book_range), tuple(config.character_sets))
+    memo = config.__dict__.get('_fingerprint_memo')
+    if memo is None or memo[0] != state:
+        categories = tuple((char_set.name, tuple(char_set.characters)) for char_set in config.character_sets)
+        memo = (state, _fingerprint_tail(config), tuple(build_character_list(config.character_sets)), categories)
+        config._fingerprint_memo = memo
+    return memo
+
+
+def _fingerprint_tail(config: LibraryConfig) -> str:
+    # The universe-independent part of the fingerprint payload, so universe
+    # variants of one configuration serialize the alphabet only once.
+    return json.dumps([
+        list(config.title_length_range),
+        list(config.content_length_range),
+        list(config.pages_per_book_range),
+        build_character_list(config.character_sets),
+    ], ensure_ascii=False, separators=(',', ':'))[1:]
+
+
+def _fingerprint(engine: str, universe: str, tail: str) -> str:
+    head = json.dumps([engine, universe], ensure_ascii=False, separators=(',', ':'))[:-1]
+    return hashlib.sha256(f"{head},{tail}".encode()).hexdigest()
+
+
+class GeneratorRegistry:
+    """Bounded LRU of compiled generators keyed by config fingerprint."""
+
+    def __init__(self, maxsize: int = DEFAULT_REGISTRY_SIZE):
+        if maxsize < 1:
+            raise ValueError("Registry size must be positive")
+        self.maxsize = maxsize
+        self._generators = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, config: LibraryConfig) -> DeterministicGenerator:
+        fingerprint = config_fingerprint(config)
+        generator = self._lookup(fingerprint)
+        if generator is None:
+            generator = self._insert(fingerprint, self._compile(config, fingerprint))
+        return generator
+
+    def get_for_universe(self, config: LibraryConfig, universe: str) -> DeterministicGenerator:
+        """
+        Generator for ``config`` with another universe name. A miss copies the
+        compiled generator of ``config`` instead of validating and compiling anew.
+        """
+        if universe == config.universe:
+            return self.get(config)
+        if not isinstance(universe, str):
+            raise ValueError("Universe must be a string")
+        tail = _config_memo(config)[1]
+        fingerprint = _fingerprint(config.engine, universe, tail)
+        generator = self._lookup(fingerprint)
+        if generator is None:
+            base_fingerprint = _fingerprint(config.engine, config.universe, tail)
+            base = self._lookup(base_fingerprint)
+            if base is None:
+                base = self._insert(base_fingerprint, self._compile(config, base_fingerprint))
+            generator = base.for_universe(universe)
+            generator.fingerprint = fingerprint
+            generator = self._insert(fingerprint, generator)
+        return generator
+
+    def _lookup(self, fingerprint: str):
+        with self._lock:
+            generator = self._generators.get(fingerprint)
+            if generator is not None:
+                self._generators.move_to_end(fingerprint)
+            return generator
+
+    def _insert(self, fingerprint: str, generator: DeterministicGenerator) -> DeterministicGenerator:
+        with self._lock:
+            generator = self._generators.setdefault(fingerprint, generator)
+            self._generators.move_to_end(fingerprint)
+            while len(self._generators) > self.maxsize:
+                self._generators.popitem(last=False)
+        return generator
+
+    @staticmethod
+    def _compile(config: LibraryConfig, fingerprint: str) -> DeterministicGenerator:
+        # Compile from a snapshot so later changes to the caller's config cannot
+        # alter a generator that other libraries are sharing.
+        snapshot = dataclasses.replace(config, character_sets=list(config.character_sets))
+        generator = create_generator(snapshot)
+        generator.fingerprint = fingerprint
+        return generator
+
+    def clear(self):
+        with self._lock:
+            self._generators.clear()
+
+    def __len__(self) -> int:
+        return len(self._generators)
+
+
+_default_registry = GeneratorRegistry()
+
+
+def get_generator(config: LibraryConfig) -> DeterministicGenerator:
+    return _default_registry.get(config)
+
+
+def get_universe_generator(config: LibraryConfig, universe: str) -> DeterministicGenerator:
+    return _default_registry.get_for_universe(config, universe)
+
+
+def get_default_registry() -> GeneratorRegistry:
+    return _default_registry
@@ -0,0 +1,145 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import functools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Tuple
+
+from smart_babylon_library.library.coordinates import LibraryCoordinates
+from smart_babylon_library.library.parallel import coordinate_tuples, parallel_map
+from smart_babylon_library.library.registry import DEFAULT_REGISTRY_SIZE
+
+
+class AhoCorasick:
+    """Multi-pattern matcher reporting every (start offset, pattern) in one pass."""
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = tuple(dict.fromkeys(pattern for pattern in patterns if pattern))
+        if not self.patterns:
+            raise ValueError("At least one non-empty pattern is required")
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(())
+                state = next_state
+            self._output[state] += (index,)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        pending = deque(self._goto[0].values())
+        while pending:
+            state = pending.popleft()
+            for char, next_state in self._goto[state].items():
+                pending.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str]]:
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                for index in output[state]:
+                    pattern = patterns[index]
+                    yield position - len(pattern) + 1, pattern
+
+
+@dataclass
+class ScanHit:
+    coordinates: LibraryCoordinates
+    offset: int
+    pattern: str
+
+    def to_dict(self) -> dict:
+        return {'coordinates': self.coordinates.to_dict(), 'offset': self.offset, 'pattern': self.pattern}
+
+
+@dataclass
+class ScanResult:
+    hits: List[ScanHit] = field(default_factory=list)
+    pages_scanned: int = 0
+    chars_scanned: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages_scanned / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def chars_per_second(self) -> float:
+        return self.chars_scanned / self.elapsed if self.elapsed else 0.0
+
+    def metrics(self) -> dict:
+        return {
+            'hits': len(self.hits),
+            'pages_scanned': self.pages_scanned,
+            'chars_scanned': self.chars_scanned,
+            'elapsed': self.elapsed,
+            'pages_per_second': self.pages_per_second,
+            'chars_per_second': self.chars_per_second,
+        }
+
+
+@functools.lru_cache(maxsize=DEFAULT_REGISTRY_SIZE)
+def _compile_automaton(patterns: Tuple[str, ...]) -> AhoCorasick:
+    return AhoCorasick(patterns)
+
+
+def scan_page(patterns: Tuple[str, ...], generator, values) -> Tuple[int, list]:
+    automaton = _compile_automaton(patterns)
+    content = generator.generate_page_content(values)
+    return len(content), list(automaton.iter_matches(content))
+
+
+def scan(library, coordinates, patterns: Iterable[str], workers: int = None,
+         max_hits: int = None, ordered: bool = False) -> ScanResult:
+    """
+    Scan pages for any of ``patterns``, stopping after ``max_hits`` hits.
+
+    ``coordinates`` is an iterable of page coordinates (see
+    region.iter_page_coordinates for building regions).
+    """
+    patterns = _compile_automaton(tuple(patterns)).patterns
+    task = functools.partial(scan_page, patterns)
+    result = ScanResult()
+    started = time.perf_counter()
+    results = parallel_map(library.config, task, coordinate_tuples(coordinates),
+                           workers=workers, ordered=ordered, generator=library.generator)
+    try:
+        for values, (length, matches) in results:
+            result.pages_scanned += 1
+            result.chars_scanned += length
+            if not matches:
+                continue
+            page_coordinates = LibraryCoordinates(*values)
+            for offset, pattern in matches:
+                result.hits.append(ScanHit(page_coordinates, offset, pattern))
+            if max_hits is not None and len(result.hits) >= max_hits:
+                del result.hits[max_hits:]
+                break
+    finally:
+        results.close()
+    result.elapsed = time.perf_counter() - started
+    return result
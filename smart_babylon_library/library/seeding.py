@@ -0,0 +1,51 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import hashlib
+from typing import Tuple
+
+from smart_babylon_library.library.coordinates import coordinate_text
+
+DEFAULT_PREFIX_CACHE_SIZE = 4096
+
+
+class SeedDeriver:
+    """
+    SHA-256 of ``prefix + "{kind}_{floor}:{room}:{cabinet}:{shelf}:{book}:{page}"``
+    with the hash state after each book prefix cached, so the pages of one book
+    only hash their page number. Digests are identical to hashing the whole string.
+    """
+
+    def __init__(self, prefix: bytes, maxsize: int = DEFAULT_PREFIX_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError("Prefix cache size must be positive")
+        self.maxsize = maxsize
+        self._root = hashlib.sha256(prefix)
+        self._books = {}
+
+    def _book_state(self, kind: str, values: Tuple[int, ...]):
+        key = (kind, values[:5])
+        state = self._books.get(key)
+        if state is None:
+            state = self._root.copy()
+            state.update(f"{kind}_{':'.join(map(coordinate_text, values[:5]))}:".encode())
+            if len(self._books) >= self.maxsize:
+                # Sweeps move on to new books, so dropping everything is as good as LRU here.
+                self._books.clear()
+            self._books[key] = state
+        return state
+
+    def digest(self, kind: str, values: Tuple[int, ...]) -> bytes:
+        state = self._book_state(kind, values).copy()
+        state.update(coordinate_text(values[5]).encode())
+        return state.digest()
+
+    def derive(self, kind: str, values: Tuple[int, ...]) -> int:
+        return int.from_bytes(self.digest(kind, values), 'big')
+
+    def clear(self):
+        self._books.clear()
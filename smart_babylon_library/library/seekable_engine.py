@@ -0,0 +1,119 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Random-access page generation engine ("seekable-v1").
+
+Every item gets a 32-byte key derived from its SHA-256 seed. The length is
+read from the key, and character i is taken from block i // 16, a keyed
+BLAKE2b digest of the block number (counter mode). Each character uses 4
+digest bytes scaled to an alphabet index by multiply-shift, so any window
+of a page costs O(window) and the length costs no generation at all.
+"""
+import array
+import hashlib
+import sys
+
+from smart_babylon_library.library.generator import (
+    DEFAULT_CHUNK_SIZE, VERIFY_CHUNK_SIZE, DeterministicGenerator, coordinate_values
+)
+from smart_babylon_library.library.seeding import SeedDeriver
+
+BLOCK_CHARS = 16
+
+
+class SeekableGenerator(DeterministicGenerator):
+    engine = 'seekable-v1'
+
+    def _bind_universe(self):
+        super()._bind_universe()
+        self._engine_prefix = self._universe_prefix + f"{self.engine}:".encode()
+        self._keys = SeedDeriver(self._engine_prefix)
+
+    def _get_key(self, kind: str, coordinates) -> bytes:
+        return self._keys.digest(kind, coordinate_values(coordinates))
+
+    @staticmethod
+    def _length_from_key(key: bytes, length_range) -> int:
+        min_len, max_len = length_range
+        word = int.from_bytes(key[:8], 'little')
+        return min_len + ((word * (max_len - min_len + 1)) >> 64)
+
+    def _read_indices(self, key: bytes, start: int, stop: int) -> list:
+        size = len(self._all_chars)
+        if not size:
+            raise IndexError('Cannot choose from an empty sequence')
+        first_block, last_block = start // BLOCK_CHARS, (stop - 1) // BLOCK_CHARS
+        digests = b''.join([
+            hashlib.blake2b(block.to_bytes(8, 'little'), key=key, digest_size=4 * BLOCK_CHARS).digest()
+            for block in range(first_block, last_block + 1)
+        ])
+        words = array.array('I')
+        words.frombytes(digests)
+        if sys.byteorder == 'big':
+            words.byteswap()
+        skip = start - first_block * BLOCK_CHARS
+        return [(word * size) >> 32 for word in words[skip:skip + stop - start]]
+
+    def _read(self, key: bytes, start: int, stop: int) -> str:
+        chars = self._all_chars
+        return ''.join([chars[index] for index in self._read_indices(key, start, stop)])
+
+    def _read_text(self, kind: str, coordinates, length_range, offset: int = 0, length: int = None) -> str:
+        key = self._get_key(kind, coordinates)
+        total = self._length_from_key(key, length_range)
+        stop = total if length is None else min(total, offset + length)
+        if offset >= stop:
+            return ''
+        return self._read(key, offset, stop)
+
+    def generate_book_title(self, coordinates) -> str:
+        return self._read_text('title', coordinates, self.config.title_length_range)
+
+    def generate_page_content(self, coordinates) -> str:
+        return self._read_text('content', coordinates, self.config.content_length_range)
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        key = self._get_key('content', coordinates)
+        total = self._length_from_key(key, self.config.content_length_range)
+        for start in range(0, total, chunk_size):
+            yield self._read(key, start, min(start + chunk_size, total))
+
+    def iter_page_indices(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        key = self._get_key('content', coordinates)
+        total = self._length_from_key(key, self.config.content_length_range)
+        for start in range(0, total, chunk_size):
+            yield self._read_indices(key, start, min(start + chunk_size, total))
+
+    def _page_symbol_count(self, coordinates) -> int:
+        return self._length_from_key(self._get_key('content', coordinates),
+                                     self.config.content_length_range)
+
+    def read_page_content(self, coordinates, offset: int, length: int) -> str:
+        if not self._single_chars:
+            # Offsets are in characters, positions in the keystream are symbols.
+            return super().read_page_content(coordinates, offset, length)
+        return self._read_text('content', coordinates, self.config.content_length_range, offset, length)
+
+    def verify_page_content(self, coordinates, text: str, offset: int = 0) -> bool:
+        if not self._single_chars:
+            return super().verify_page_content(coordinates, text, offset)
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        key = self._get_key('content', coordinates)
+        if offset + len(text) > self._length_from_key(key, self.config.content_length_range):
+            return False
+        # Only the window is generated, a chunk at a time.
+        for start in range(0, len(text), VERIFY_CHUNK_SIZE):
+            stop = min(start + VERIFY_CHUNK_SIZE, len(text))
+            if self._read(key, offset + start, offset + stop) != text[start:stop]:
+                return False
+        return True
+
+    def get_max_pages_for_book(self, coordinates) -> int:
+        return self._length_from_key(self._get_key('pages', coordinates),
+                                     self.config.pages_per_book_range)
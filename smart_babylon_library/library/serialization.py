@@ -0,0 +1,135 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+import io
+import json
+
+from smart_babylon_library.library.config import JSON_FORMATS
+from smart_babylon_library.library.coordinates import LARGE_COORDINATE_BITS, encode_coordinate
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+COORDINATE_FIELDS = ('floor', 'room', 'cabinet', 'shelf', 'book', 'page')
+
+_COORDINATES_TEMPLATE = '{"floor":%d,"room":%d,"cabinet":%d,"shelf":%d,"book":%d,"page":%d}'
+
+
+def check_json_format(fmt: str) -> str:
+    if fmt not in JSON_FORMATS:
+        raise ValueError(f"Unknown JSON format '{fmt}', expected one of {', '.join(JSON_FORMATS)}")
+    return fmt
+
+
+def encode_string(text: str) -> str:
+    """Encode ``text`` as a JSON string literal, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(text).decode()
+    return json.dumps(text, ensure_ascii=False)
+
+
+def text_writer(fp):
+    """Return a write callable taking str for a text stream, a binary stream or a bytearray."""
+    if isinstance(fp, bytearray):
+        return lambda text: fp.extend(text.encode())
+    if isinstance(fp, (io.RawIOBase, io.BufferedIOBase)):
+        return lambda text: fp.write(text.encode())
+    return fp.write
+
+
+def _coordinate_json(value: int) -> str:
+    return '%d' % value if value.bit_length() <= LARGE_COORDINATE_BITS else '"%s"' % hex(value)
+
+
+def _coordinates_text(values) -> str:
+    if max(values).bit_length() <= LARGE_COORDINATE_BITS:
+        return _COORDINATES_TEMPLATE % tuple(values)
+    return _COORDINATES_TEMPLATE.replace('%d', '%s') % tuple(map(_coordinate_json, values))
+
+
+def _coordinates_dict(values) -> dict:
+    return {field: encode_coordinate(value) for field, value in zip(COORDINATE_FIELDS, values)}
+
+
+def _record_prefix(universe: str, values) -> str:
+    return '{"universe":%s,"coordinates":%s' % (encode_string(universe), _coordinates_text(values))
+
+
+def page_record(universe: str, values, content: str, fmt: str = 'compact') -> str:
+    """Encode a page as LibraryPage.to_dict would, without building the dictionary."""
+    if check_json_format(fmt) == 'pretty':
+        record = {
+            'universe': universe,
+            'coordinates': _coordinates_dict(values),
+            'page_number': encode_coordinate(values[5]),
+            'content': content
+        }
+        return json.dumps(record, ensure_ascii=False, indent=2)
+    text = '%s,"page_number":%s,"content":%s}' % (_record_prefix(universe, values), _coordinate_json(values[5]),
+                                                   encode_string(content))
+    return text + '\n' if fmt == 'jsonl' else text
+
+
+def book_record(universe: str, values, title: str, page_count: int, fmt: str = 'compact') -> str:
+    """Encode a book as LibraryBook.to_dict would, without building the dictionary."""
+    if check_json_format(fmt) == 'pretty':
+        record = {
+            'universe': universe,
+            'coordinates': _coordinates_dict(values),
+            'title': title,
+            'page_count': page_count
+        }
+        return json.dumps(record, ensure_ascii=False, indent=2)
+    text = '%s,"title":%s,"page_count":%d}' % (_record_prefix(universe, values), encode_string(title),
+                                                page_count)
+    return text + '\n' if fmt == 'jsonl' else text
+
+
+def write_page_record(fp, universe: str, values, chunks, fmt: str = 'compact') -> int:
+    """Stream a page record whose content arrives as ``chunks``; returns the characters written."""
+    write = text_writer(fp)
+    if check_json_format(fmt) == 'pretty':
+        header = {
+            'universe': universe,
+            'coordinates': _coordinates_dict(values),
+            'page_number': encode_coordinate(values[5]),
+        }
+        head = json.dumps(header, ensure_ascii=False, indent=2)[:-2] + ',\n  "content": "'
+        tail = '"\n}'
+    else:
+        head = '%s,"page_number":%s,"content":"' % (_record_prefix(universe, values), _coordinate_json(values[5]))
+        tail = '"}\n' if fmt == 'jsonl' else '"}'
+    write(head)
+    written = len(head) + len(tail)
+    for chunk in chunks:
+        encoded = encode_string(chunk)[1:-1]
+        write(encoded)
+        written += len(encoded)
+    write(tail)
+    return written
+
+
+def write_page_records(fp, universe: str, pages) -> int:
+    """Write ``(values, content)`` pairs as JSON lines; returns the number of records."""
+    write = text_writer(fp)
+    count = 0
+    for values, content in pages:
+        write(page_record(universe, values, content, 'jsonl'))
+        count += 1
+    return count
+
+
+def write_book_records(fp, universe: str, books) -> int:
+    """Write ``(values, (title, page_count))`` pairs as JSON lines; returns the number of records."""
+    write = text_writer(fp)
+    count = 0
+    for values, (title, page_count) in books:
+        write(book_record(universe, values, title, page_count, 'jsonl'))
+        count += 1
+    return count
@@ -0,0 +1,209 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Stdlib asyncio HTTP/1.1 service for books and pages.
+
+    GET /book/{floor}/{room}/{cabinet}/{shelf}/{book}
+    GET /page/{floor}/{room}/{cabinet}/{shelf}/{book}/{page}
+
+Content is a pure function of (config, coordinates), so responses carry a
+strong ETag derived from the config fingerprint, the JSON format and the
+coordinates, plus a long-lived immutable Cache-Control. Conditional requests are answered with
+304 before anything is generated. Generation runs in a worker pool.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import os
+
+from smart_babylon_library.library.book import LibraryBook, LibraryPage
+from smart_babylon_library.library.coordinates import LibraryCoordinates, coordinate_text, parse_coordinate
+from smart_babylon_library.library.parallel import _init_worker, _run_batch
+
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+MAX_HEADER_BYTES = 16384
+KEEP_ALIVE_TIMEOUT = 15.0
+
+_REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 500: 'Internal Server Error'}
+_ROUTES = {'book': 5, 'page': 6}
+
+
+# Renderers take the library's own config: configs differing only in json_format
+# share one compiled generator, so generator.config may carry another format.
+def render_book_json(generator, values, config=None) -> str:
+    return LibraryBook(LibraryCoordinates(*values), config or generator.config, generator).to_json()
+
+
+def render_page_json(generator, values, config=None) -> str:
+    return LibraryPage(LibraryCoordinates(*values), config or generator.config, generator).to_json()
+
+
+_RENDERERS = {'book': render_book_json, 'page': render_page_json}
+
+
+def _worker_ready() -> bool:
+    return True
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, message: str = None):
+        super().__init__(message or _REASONS[status])
+        self.status = status
+
+
+class LibraryServer:
+    def __init__(self, library, host: str = '127.0.0.1', port: int = 8000,
+                 workers: int = None, executor: str = 'process'):
+        if executor not in ('process', 'thread'):
+            raise ValueError("Executor must be 'process' or 'thread'")
+        self.library = library
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+        self._pool = None
+        self._server = None
+
+    def etag(self, kind: str, values) -> str:
+        key = (f"{self.library.generator.fingerprint}:{self.library.config.json_format}:"
+               f"{kind}:{':'.join(map(coordinate_text, values))}")
+        return '"' + hashlib.sha256(key.encode()).hexdigest()[:32] + '"'
+
+    async def start(self):
+        if self.executor == 'process':
+            self._pool = concurrent.futures.ProcessPoolExecutor(
+                self.workers, initializer=_init_worker, initargs=(self.library.config,))
+            # Workers are forked lazily; start them all before the listening socket
+            # exists, or they inherit it and the connection being served.
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*[loop.run_in_executor(self._pool, _worker_ready) for _ in range(self.workers)])
+        else:
+            self._pool = concurrent.futures.ThreadPoolExecutor(self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  limit=MAX_HEADER_BYTES)
+        if self.port == 0:
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    async def _render(self, kind: str, values) -> str:
+        loop = asyncio.get_running_loop()
+        renderer = functools.partial(_RENDERERS[kind], config=self.library.config)
+        if self.executor == 'process':
+            results = await loop.run_in_executor(self._pool, _run_batch, renderer, [values])
+            return results[0]
+        return await loop.run_in_executor(self._pool, renderer, self.library.generator, values)
+
+    def _route(self, method: str, target: str):
+        if method not in ('GET', 'HEAD'):
+            raise _HttpError(405)
+        parts = target.split('?', 1)[0].strip('/').split('/')
+        kind = parts[0]
+        if kind not in _ROUTES or len(parts) != _ROUTES[kind] + 1:
+            raise _HttpError(404)
+        try:
+            values = tuple(parse_coordinate(part) for part in parts[1:])
+        except ValueError:
+            raise _HttpError(400, "Coordinates must be integers") from None
+        if any(value < 0 for value in values):
+            raise _HttpError(400, "All coordinates must be non-negative")
+        if kind == 'book':
+            values += (0,)
+        return kind, values
+
+    async def _respond(self, method: str, target: str, headers: dict):
+        kind, values = self._route(method, target)
+        etag = self.etag(kind, values)
+        cache_headers = {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None:
+            candidates = [tag.strip() for tag in if_none_match.split(',')]
+            if '*' in candidates or etag in candidates:
+                return 304, cache_headers, b''
+        body = (await self._render(kind, values)).encode()
+        cache_headers['Content-Type'] = 'application/json; charset=utf-8'
+        return 200, cache_headers, body
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                        ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ')
+                except ValueError:
+                    await self._write(writer, 400, {}, b'', keep_alive=False, head_only=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                try:
+                    # Request bodies are not used, but must be consumed to keep the stream in sync.
+                    body_length = int(headers.get('content-length', 0))
+                    if body_length:
+                        await reader.readexactly(body_length)
+                except (ValueError, asyncio.IncompleteReadError):
+                    break
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                try:
+                    status, response_headers, body = await self._respond(method, target, headers)
+                except _HttpError as error:
+                    status, body = error.status, str(error).encode()
+                    response_headers = {'Content-Type': 'text/plain; charset=utf-8'}
+                except Exception:
+                    status, response_headers, body = 500, {}, b''
+                await self._write(writer, status, response_headers, body, keep_alive, method == 'HEAD')
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer, status: int, headers: dict, body: bytes, keep_alive: bool, head_only: bool):
+        lines = [f"HTTP/1.1 {status} {_REASONS[status]}"]
+        headers = dict(headers)
+        if status != 304:
+            headers['Content-Length'] = str(len(body))
+        headers['Connection'] = 'keep-alive' if keep_alive else 'close'
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+        if body and not head_only:
+            writer.write(body)
+        await writer.drain()
+
+
+def serve(library, host: str = '127.0.0.1', port: int = 8000, workers: int = None, executor: str = 'process'):
+    server = LibraryServer(library, host, port, workers, executor)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
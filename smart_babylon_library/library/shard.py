@@ -0,0 +1,227 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Materialized shards: precomputed pages of a coordinate region, served through mmap.
+
+Layout: a header (magic, version, bytes per character, config fingerprint, page
+count, index offset), the page data back to back, then the index of
+(floor, room, cabinet, shelf, book, page, data offset, length) records as
+little-endian uint64. Characters are one byte each (the index of the symbol in
+the configuration's distinct alphabet) when the alphabet has at most 256
+symbols, otherwise four bytes of UTF-32-LE, so any character window is a fixed
+slice of the mapping.
+"""
+import codecs
+import mmap
+import os
+import struct
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE, coordinate_values
+from smart_babylon_library.library.packed import get_codec
+from smart_babylon_library.library.parallel import coordinate_tuples, generate_page, parallel_map
+from smart_babylon_library.library.registry import config_fingerprint
+
+SHARD_MAGIC = b'SBLS'
+SHARD_VERSION = 1
+
+_HEADER = struct.Struct('<4sBB32sQQ')
+_INDEX_ENTRY = struct.Struct('<8Q')
+_MAX_VALUE = 2 ** 64 - 1
+
+
+def _character_format(config: LibraryConfig):
+    """Return (bytes per character, encode, decode) for a configuration."""
+    symbols = get_codec(config).symbols
+    # Offsets are character positions, so one byte per character needs one
+    # code point per symbol.
+    if len(symbols) > 256 or any(len(symbol) != 1 for symbol in symbols):
+        return 4, lambda text: text.encode('utf-32-le'), lambda data: codecs.decode(data, 'utf-32-le')
+    table = {ord(char): index for index, char in enumerate(symbols)}
+    decoding_map = ''.join(symbols) + '\ufffe' * (256 - len(symbols))
+    return (1, lambda text: text.translate(table).encode('latin-1'),
+            lambda data: codecs.charmap_decode(data, 'strict', decoding_map)[0])
+
+
+def materialize(config: LibraryConfig, coordinates, path, workers: int = None, generator=None) -> int:
+    """Generate the pages for ``coordinates`` into a shard file at ``path``; returns the page count."""
+    width, encode, _ = _character_format(config)
+    fingerprint = bytes.fromhex(config_fingerprint(config))
+    index = []
+    # Written next to ``path`` and moved into place, so a mounted shard at the
+    # same path keeps mapping the old file.
+    path = os.fspath(path)
+    temporary = f'{path}.tmp'
+    try:
+        with open(temporary, 'wb') as fp:
+            fp.write(_HEADER.pack(SHARD_MAGIC, SHARD_VERSION, width, fingerprint, 0, 0))
+            offset = _HEADER.size
+            for values, content in parallel_map(config, generate_page, coordinate_tuples(coordinates),
+                                                workers=workers, generator=generator):
+                if max(values) > _MAX_VALUE:
+                    raise ValueError("Shard coordinates must fit in 64 bits")
+                fp.write(encode(content))
+                index.append(_INDEX_ENTRY.pack(*values, offset, len(content)))
+                offset += len(content) * width
+            fp.write(b''.join(index))
+            fp.seek(0)
+            fp.write(_HEADER.pack(SHARD_MAGIC, SHARD_VERSION, width, fingerprint, len(index), offset))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return len(index)
+
+
+class Shard:
+    """
+    A mounted shard file. Lookups are a dictionary probe and content is sliced
+    straight out of the memory map; ``get_view`` returns the raw bytes as a
+    zero-copy memoryview, which must be released before ``close``.
+    """
+
+    def __init__(self, path, config: LibraryConfig = None):
+        self.path = os.fspath(path)
+        self.config = config or LibraryConfig()
+        width, _, self._decode = _character_format(self.config)
+        with open(self.path, 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._view = memoryview(self._mmap)
+            self._index = self._load_index(width)
+        except Exception:
+            self.close()
+            raise
+        self.width = width
+
+    def _load_index(self, width: int) -> dict:
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError("Not a shard file")
+        magic, version, found_width, fingerprint, count, index_offset = _HEADER.unpack_from(self._mmap)
+        if magic != SHARD_MAGIC:
+            raise ValueError("Not a shard file")
+        if version != SHARD_VERSION:
+            raise ValueError(f"Unsupported shard version {version}")
+        if fingerprint != bytes.fromhex(config_fingerprint(self.config)) or found_width != width:
+            raise ValueError("Shard belongs to a different library configuration")
+        if index_offset + count * _INDEX_ENTRY.size != len(self._mmap):
+            raise ValueError("Truncated shard file")
+        self.fingerprint = fingerprint.hex()
+        index = {}
+        for entry in _INDEX_ENTRY.iter_unpack(self._view[index_offset:]):
+            index[entry[:6]] = (entry[6], entry[7])
+        return index
+
+    def __contains__(self, coordinates) -> bool:
+        return coordinate_values(coordinates) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def locate(self, coordinates):
+        """Return (data offset, length) of a page, or None when it is not in the shard."""
+        return self._index.get(coordinate_values(coordinates))
+
+    def get_view(self, coordinates, offset: int = 0, length: int = None) -> memoryview:
+        entry = self._index.get(coordinate_values(coordinates))
+        if entry is None:
+            raise KeyError(coordinates)
+        start, page_length = entry
+        offset = min(offset, page_length)
+        end = page_length if length is None else min(page_length, offset + length)
+        return self._view[start + offset * self.width:start + end * self.width]
+
+    def read(self, coordinates, offset: int = 0, length: int = None) -> str:
+        return self._decode(self.get_view(coordinates, offset, length))
+
+    def iter_chunks(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        _, page_length = self._index[coordinate_values(coordinates)]
+        for start in range(0, page_length, chunk_size):
+            yield self.read(coordinates, start, chunk_size)
+
+    @property
+    def closed(self) -> bool:
+        return self._mmap is None
+
+    def close(self):
+        if self._mmap is None:
+            return
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ShardedGenerator:
+    """
+    Serves page content from mounted shards and delegates everything else,
+    including pages outside every shard, to the wrapped generator.
+    """
+
+    def __init__(self, generator, shards):
+        self._generator = generator
+        self.shards = shards
+
+    def __getattr__(self, name):
+        return getattr(self._generator, name)
+
+    def _find(self, values):
+        # Pages created before unmount_shard keep this wrapper, so closed shards
+        # are skipped and their pages fall back to generation.
+        for shard in self.shards:
+            entry = shard._index.get(values)
+            if entry is not None and not shard.closed:
+                return shard, entry[1]
+        return None, 0
+
+    def generate_page_content(self, coordinates) -> str:
+        values = coordinate_values(coordinates)
+        shard, _ = self._find(values)
+        if shard is None:
+            return self._generator.generate_page_content(coordinates)
+        return shard.read(values)
+
+    def get_page_length(self, coordinates) -> int:
+        shard, length = self._find(coordinate_values(coordinates))
+        if shard is None:
+            return self._generator.get_page_length(coordinates)
+        return length
+
+    def read_page_content(self, coordinates, offset: int, length: int) -> str:
+        values = coordinate_values(coordinates)
+        shard, _ = self._find(values)
+        if shard is None:
+            return self._generator.read_page_content(coordinates, offset, length)
+        return shard.read(values, offset, length)
+
+    def verify_page_content(self, coordinates, text: str, offset: int = 0) -> bool:
+        values = coordinate_values(coordinates)
+        shard, length = self._find(values)
+        if shard is None:
+            return self._generator.verify_page_content(coordinates, text, offset)
+        if offset < 0:
+            raise ValueError("Offset must be non-negative")
+        return offset + len(text) <= length and shard.read(values, offset, len(text)) == text
+
+    def iter_page_content(self, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        values = coordinate_values(coordinates)
+        shard, _ = self._find(values)
+        if shard is None:
+            return self._generator.iter_page_content(coordinates, chunk_size)
+        return shard.iter_chunks(values, chunk_size)
@@ -0,0 +1,189 @@
+# --------------------------------------------------------
+# Licensed under the terms of the BSD 3-Clause License
+# (see LICENSE for details).
+# Copyright © 2025, Alexander Suvorov
+# --------------------------------------------------------
+# https://github.com/smartlegionlab
+# --------------------------------------------------------
+"""
+Page statistics computed from the generated index stream.
+
+Symbol histograms, CharacterSet category counts, run counts and the length
+distribution are accumulated from each generator's ``iter_page_indices``
+without decoding text. PageStats values merge with ``+``, so workers can
+reduce their share of a region and the caller combines the partial results.
+"""
+import functools
+import math
+import operator
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from smart_babylon_library.library.config import LibraryConfig
+from smart_babylon_library.library.generator import DEFAULT_CHUNK_SIZE
+from smart_babylon_library.library.registry import (
+    DEFAULT_REGISTRY_SIZE, config_alphabet, config_categories, config_fingerprint
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+def length_bucket(length: int) -> int:
+    """Smallest power of two that is at least ``length`` (0 for empty pages)."""
+    return 1 << (length - 1).bit_length() if length > 0 else 0
+
+
+@dataclass
+class PageStats:
+    symbols: Tuple[str, ...]
+    symbol_counts: List[int]
+    category_counts: Dict[str, int]
+    pages: int = 0
+    chars: int = 0
+    runs: int = 0
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    length_buckets: Dict[int, int] = field(default_factory=dict)
+
+    def merge(self, other: 'PageStats') -> 'PageStats':
+        """Add ``other`` into these statistics in place and return them."""
+        if other.symbols != self.symbols:
+            raise ValueError("Cannot merge statistics over different alphabets")
+        self.symbol_counts = [a + b for a, b in zip(self.symbol_counts, other.symbol_counts)]
+        for name, count in other.category_counts.items():
+            self.category_counts[name] = self.category_counts.get(name, 0) + count
+        for bucket, count in other.length_buckets.items():
+            self.length_buckets[bucket] = self.length_buckets.get(bucket, 0) + count
+        self.pages += other.pages
+        self.chars += other.chars
+        self.runs += other.runs
+        if other.min_length is not None:
+            self.min_length = other.min_length if self.min_length is None else min(self.min_length, other.min_length)
+            self.max_length = other.max_length if self.max_length is None else max(self.max_length, other.max_length)
+        return self
+
+    def copy(self) -> 'PageStats':
+        return PageStats(self.symbols, list(self.symbol_counts), dict(self.category_counts), self.pages,
+                         self.chars, self.runs, self.min_length, self.max_length, dict(self.length_buckets))
+
+    def __add__(self, other: 'PageStats') -> 'PageStats':
+        return self.copy().merge(other)
+
+    @property
+    def frequencies(self) -> Dict[str, int]:
+        return {symbol: count for symbol, count in zip(self.symbols, self.symbol_counts) if count}
+
+    @property
+    def entropy(self) -> float:
+        """Shannon entropy of the symbol distribution in bits per character."""
+        if not self.chars:
+            return 0.0
+        return -sum(count / self.chars * math.log2(count / self.chars) for count in self.symbol_counts if count)
+
+    @property
+    def mean_length(self) -> float:
+        return self.chars / self.pages if self.pages else 0.0
+
+    @property
+    def mean_run_length(self) -> float:
+        return self.chars / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'pages': self.pages,
+            'chars': self.chars,
+            'runs': self.runs,
+            'min_length': self.min_length,
+            'max_length': self.max_length,
+            'mean_length': self.mean_length,
+            'mean_run_length': self.mean_run_length,
+            'entropy': self.entropy,
+            'length_buckets': dict(sorted(self.length_buckets.items())),
+            'categories': dict(self.category_counts),
+            'frequencies': self.frequencies,
+        }
+
+
+class StatsLayout:
+    """Maps indices into a generator's character list onto distinct symbols and categories."""
+
+    def __init__(self, alphabet, categories):
+        self.symbols = tuple(dict.fromkeys(alphabet))
+        position = {symbol: index for index, symbol in enumerate(self.symbols)}
+        self.fold = [position[char] for char in alphabet]
+        self.categories = {}
+        for name, characters in categories:
+            members = self.categories.setdefault(name, set())
+            members.update(position[char] for char in characters if char in position)
+        self._fold_bytes = None
+        if len(self.fold) <= 256:
+            self._fold_bytes = bytes(self.fold) + bytes(256 - len(self.fold))
+        self._fold_array = np.array(self.fold, dtype=np.intp) if np is not None else None
+
+    def empty(self) -> PageStats:
+        return PageStats(self.symbols, [0] * len(self.symbols), {name: 0 for name in self.categories})
+
+    def _count_chunk(self, chunk, counts: list, previous):
+        """Add a chunk of raw indices to ``counts``; returns (new runs, last symbol)."""
+        if self._fold_array is not None:
+            if isinstance(chunk, (bytes, bytearray)):
+                chunk = np.frombuffer(chunk, dtype=np.uint8)
+            symbols = self._fold_array[np.asarray(chunk, dtype=np.intp)]
+            for index, count in enumerate(np.bincount(symbols, minlength=len(self.symbols)).tolist()):
+                counts[index] += count
+            changes = int(np.count_nonzero(symbols[1:] != symbols[:-1]))
+            first, last = int(symbols[0]), int(symbols[-1])
+        else:
+            if isinstance(chunk, (bytes, bytearray)) and self._fold_bytes is not None:
+                symbols = chunk.translate(self._fold_bytes)
+            else:
+                fold = self.fold
+                symbols = [fold[index] for index in chunk]
+            for index, count in Counter(symbols).items():
+                counts[index] += count
+            changes = sum(map(operator.ne, symbols, symbols[1:]))
+            first, last = symbols[0], symbols[-1]
+        return changes + (previous != first), last
+
+    def page_stats(self, generator, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PageStats:
+        stats = self.empty()
+        counts = stats.symbol_counts
+        runs = length = 0
+        previous = None
+        for chunk in generator.iter_page_indices(coordinates, chunk_size):
+            if not len(chunk):
+                continue
+            new_runs, previous = self._count_chunk(chunk, counts, previous)
+            runs += new_runs
+            length += len(chunk)
+        for name, members in self.categories.items():
+            stats.category_counts[name] = sum(counts[index] for index in members)
+        stats.pages, stats.chars, stats.runs = 1, length, runs
+        stats.min_length = stats.max_length = length
+        stats.length_buckets[length_bucket(length)] = 1
+        return stats
+
+
+@functools.lru_cache(maxsize=DEFAULT_REGISTRY_SIZE)
+def _compile_layout(fingerprint: str, alphabet: tuple, categories: tuple) -> StatsLayout:
+    return StatsLayout(alphabet, categories)
+
+
+def get_layout(config: LibraryConfig) -> StatsLayout:
+    return _compile_layout(config_fingerprint(config), config_alphabet(config), config_categories(config))
+
+
+def page_stats(generator, coordinates, chunk_size: int = DEFAULT_CHUNK_SIZE) -> PageStats:
+    return get_layout(generator.config).page_stats(generator, coordinates, chunk_size)
+
+
+def merge_stats(stats, config: LibraryConfig) -> PageStats:
+    """Reduce an iterable of PageStats; an empty iterable gives empty statistics."""
+    total = get_layout(config).empty()
+    for item in stats:
+        total.merge(item)
+    return total